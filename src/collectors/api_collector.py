@@ -1,14 +1,38 @@
 """
 API采集器模块 - 处理API类型数据源的采集
 """
-import time
+import io
 import requests
 import logging
-import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional
-from urllib.parse import quote
+from typing import Dict, Any, List, Optional, Callable
+from urllib.parse import quote, urlparse
+
+try:
+    from lxml import etree
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 from .base_collector import BaseCollector
+from ..utils.http_cache import get_http_cache
+from ..utils.http_session import get_session
+from ..utils.rate_limiter import get_rate_limiter
+
+# arXiv Atom标签（Clark记法，避免每次查找时解析命名空间前缀）
+ATOM = '{http://www.w3.org/2005/Atom}'
+TAG_ENTRY = ATOM + 'entry'
+TAG_TITLE = ATOM + 'title'
+TAG_ID = ATOM + 'id'
+TAG_SUMMARY = ATOM + 'summary'
+TAG_AUTHOR_NAME = ATOM + 'author/' + ATOM + 'name'
+TAG_PUBLISHED = ATOM + 'published'
+TAG_LINK = ATOM + 'link'
 
 class ApiCollector(BaseCollector):
     """
@@ -28,11 +52,23 @@ class ApiCollector(BaseCollector):
         self.search_params = source_config.get('search_params', {})
         self.rate_limit = source_config.get('rate_limit', 1)  # 默认每秒1次请求
         self.parser_name = source_config.get('parser', '')
+        # 每次请求合并的关键词数量
+        self.keywords_per_request = max(1, source_config.get('keywords_per_request', 20))
+        self.session = get_session()
+        self.http_cache = get_http_cache()
+        # 同一主机共享令牌桶，允许突发至 burst 次请求后按 rate_limit 放行
+        self.rate_limiter = get_rate_limiter(
+            urlparse(self.base_url).netloc,
+            self.rate_limit,
+            source_config.get('burst')
+        )
     
     def collect(self, keywords: List[str], max_results: int = 10) -> List[Dict[str, Any]]:
         """
         从API收集文章数据
         
+        关键词按 keywords_per_request 分组，每组通过服务端 OR 查询合并为一次请求
+        
         Args:
             keywords: 关键词列表
             max_results: 最大结果数
@@ -40,21 +76,47 @@ class ApiCollector(BaseCollector):
         Returns:
             List[Dict]: 文章数据列表
         """
-        self._log_collection_start(keywords)
+        groups = [keywords[i:i + self.keywords_per_request]
+                  for i in range(0, len(keywords), self.keywords_per_request)]
+        return self.collect_batched(groups, max_results)
+    
+    def collect_batched(self, keyword_groups: List[List[str]], max_results: int = 10) -> List[Dict[str, Any]]:
+        """
+        按关键词分组收集文章数据，每组发送一次请求，并按DOI/URL跨组去重
+        
+        Args:
+            keyword_groups: 关键词分组列表
+            max_results: 每组的最大结果数
+            
+        Returns:
+            List[Dict]: 去重后的文章数据列表
+        """
+        self._log_collection_start([keyword for group in keyword_groups for keyword in group])
         
-        # 根据数据源选择合适的解析器
+        articles = []
+        seen = set()
+        for group in keyword_groups:
+            for article in self._collect_group(group, max_results):
+                key = article.get('doi') or article.get('url')
+                if key in seen:
+                    continue
+                seen.add(key)
+                articles.append(article)
+        
+        self._log_collection_end(len(articles))
+        return articles
+    
+    def _collect_group(self, keywords: List[str], max_results: int) -> List[Dict[str, Any]]:
+        """根据数据源选择合适的解析器，对一组关键词发送一次请求"""
         if self.source_id == 'arxiv':
-            articles = self._collect_from_arxiv(keywords, max_results)
+            return self._collect_from_arxiv(keywords, max_results)
         elif self.source_id == 'springer':
-            articles = self._collect_from_springer(keywords, max_results)
+            return self._collect_from_springer(keywords, max_results)
         elif self.source_id == 'elsevier':
-            articles = self._collect_from_elsevier(keywords, max_results)
-        else:
-            self.logger.warning(f"未知的API数据源: {self.source_id}")
-            articles = []
+            return self._collect_from_elsevier(keywords, max_results)
         
-        self._log_collection_end(len(articles))
-        return articles
+        self.logger.warning(f"未知的API数据源: {self.source_id}")
+        return []
     
     def _collect_from_arxiv(self, keywords: List[str], max_results: int) -> List[Dict[str, Any]]:
         """从arXiv API收集数据"""
@@ -67,51 +129,111 @@ class ApiCollector(BaseCollector):
         params['max_results'] = max_results
         
         try:
-            # 发送请求
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-            
-            # 解析XML响应
-            return self._parse_arxiv_response(response.text)
+            # 发送请求并解析XML响应
+            # 流式读取响应，下载的同时逐条解析entry
+            return self._fetch_with_cache(
+                params,
+                lambda response: self._parse_arxiv_response(self._raw_stream(response)),
+                stream=True
+            )
         except requests.RequestException as e:
             self.logger.error(f"arXiv API请求失败: {str(e)}")
             return []
     
-    def _parse_arxiv_response(self, xml_content: str) -> List[Dict[str, Any]]:
-        """解析arXiv API的XML响应"""
+    def _fetch_with_cache(self,
+                          params: Dict[str, Any],
+                          parse: Callable[[requests.Response], List[Dict[str, Any]]],
+                          headers: Optional[Dict[str, str]] = None,
+                          stream: bool = False) -> List[Dict[str, Any]]:
+        """
+        发送带条件请求头的GET请求，服务器返回304时直接使用缓存的文章列表
+        
+        Args:
+            params: 查询参数
+            parse: 响应解析函数
+            headers: 额外请求头
+            stream: 是否流式读取响应体（边下载边解析）
+            
+        Returns:
+            List[Dict]: 文章数据列表
+        """
+        cache_key = self.http_cache.make_key(self.base_url, params)
+        request_headers = dict(headers or {})
+        request_headers.update(self.http_cache.conditional_headers(cache_key))
+        
+        self._respect_rate_limit()
+        with self.session.get(self.base_url, params=params, headers=request_headers,
+                              stream=stream) as response:
+            if response.status_code != 304:
+                return self._parse_and_cache(cache_key, response, parse)
+            
+            cached = self.http_cache.load_articles(cache_key)
+            if cached is not None:
+                self.logger.info(f"{self.name} 内容未更新(304)，使用缓存的 {len(cached)} 篇文章")
+                return cached
+        
+        # 缓存已丢失，重新发送无条件请求
+        self._respect_rate_limit()
+        with self.session.get(self.base_url, params=params, headers=headers,
+                              stream=stream) as response:
+            return self._parse_and_cache(cache_key, response, parse)
+    
+    def _parse_and_cache(self,
+                         cache_key: str,
+                         response: requests.Response,
+                         parse: Callable[[requests.Response], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """解析响应，并保存校验信息和文章列表供下次条件请求使用"""
+        response.raise_for_status()
+        articles = parse(response)
+        self.http_cache.store(
+            cache_key,
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            articles
+        )
+        return articles
+    
+    def _parse_arxiv_response(self, xml_content) -> List[Dict[str, Any]]:
+        """
+        解析arXiv API的XML响应
+
+        使用iterparse逐条处理entry，处理完即释放，内存占用与结果数量无关
+        
+        Args:
+            xml_content: XML字节串或可读的文件对象（如流式响应）
+        """
         articles = []
         
         try:
-            # 定义命名空间
-            namespaces = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
+            if isinstance(xml_content, (bytes, str)):
+                if isinstance(xml_content, str):
+                    xml_content = xml_content.encode('utf-8')
+                xml_content = io.BytesIO(xml_content)
             
-            # 解析XML
-            root = ET.fromstring(xml_content)
-            
-            # 提取文章信息
-            for entry in root.findall('.//atom:entry', namespaces):
-                title = entry.find('./atom:title', namespaces).text.strip()
-                url = entry.find('./atom:id', namespaces).text.strip()
+            # 逐个解析entry元素
+            for _, entry in etree.iterparse(xml_content, events=('end',)):
+                if entry.tag != TAG_ENTRY:
+                    continue
+                
+                title = entry.find(TAG_TITLE).text.strip()
+                url = entry.find(TAG_ID).text.strip()
                 
                 # 获取摘要
-                abstract = entry.find('./atom:summary', namespaces)
+                abstract = entry.find(TAG_SUMMARY)
                 abstract_text = abstract.text.strip() if abstract is not None else ''
                 
                 # 获取作者
                 authors = []
-                for author in entry.findall('./atom:author/atom:name', namespaces):
+                for author in entry.iterfind(TAG_AUTHOR_NAME):
                     authors.append(author.text.strip())
                 
                 # 获取发布日期
-                published = entry.find('./atom:published', namespaces)
+                published = entry.find(TAG_PUBLISHED)
                 published_date = published.text[:10] if published is not None else None
                 
                 # 获取DOI（如果有）
                 doi = None
-                for link in entry.findall('./atom:link', namespaces):
+                for link in entry.iterfind(TAG_LINK):
                     if link.get('title') == 'doi':
                         doi = link.get('href')
                         break
@@ -128,6 +250,12 @@ class ApiCollector(BaseCollector):
                 )
                 
                 articles.append(article)
+                
+                # 释放已处理的entry及其前序兄弟节点
+                entry.clear()
+                if hasattr(entry, 'getprevious'):
+                    while entry.getprevious() is not None:
+                        del entry.getparent()[0]
             
             return articles
         except Exception as e:
@@ -145,13 +273,11 @@ class ApiCollector(BaseCollector):
         params['p'] = max_results
         
         try:
-            # 发送请求
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-            
-            # 解析JSON响应
-            data = response.json()
-            return self._parse_springer_response(data)
+            # 发送请求并解析JSON响应
+            return self._fetch_with_cache(
+                params,
+                lambda response: self._parse_springer_response(_json_loads(response.content))
+            )
         except requests.RequestException as e:
             self.logger.error(f"Springer API请求失败: {str(e)}")
             return []
@@ -226,13 +352,12 @@ class ApiCollector(BaseCollector):
         }
         
         try:
-            # 发送请求
-            response = requests.get(self.base_url, params=params, headers=headers)
-            response.raise_for_status()
-            
-            # 解析JSON响应
-            data = response.json()
-            return self._parse_elsevier_response(data)
+            # 发送请求并解析JSON响应
+            return self._fetch_with_cache(
+                params,
+                lambda response: self._parse_elsevier_response(_json_loads(response.content)),
+                headers
+            )
         except requests.RequestException as e:
             self.logger.error(f"Elsevier API请求失败: {str(e)}")
             return []
@@ -286,6 +411,5 @@ class ApiCollector(BaseCollector):
             return []
     
     def _respect_rate_limit(self) -> None:
-        """遵循API速率限制"""
-        if self.rate_limit > 0:
-            time.sleep(1.0 / self.rate_limit)
+        """遵循API速率限制（按主机共享的令牌桶）"""
+        self.rate_limiter.acquire()
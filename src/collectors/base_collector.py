@@ -1,10 +1,15 @@
 """
 基础采集器模块 - 定义数据采集的基础接口
 """
+import sys
 import logging
+import requests
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
+logger = logging.getLogger(__name__)
+
 class BaseCollector(ABC):
     """
     数据采集器基类，定义通用接口和方法
@@ -18,9 +23,10 @@ class BaseCollector(ABC):
             source_id: 数据源ID
             source_config: 数据源配置
         """
-        self.source_id = source_id
+        # 每篇文章都会引用这些字符串，驻留后所有文章共享同一对象
+        self.source_id = sys.intern(source_id)
         self.source_config = source_config
-        self.name = source_config.get('name', source_id)
+        self.name = sys.intern(source_config.get('name', source_id))
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
     @abstractmethod
@@ -68,12 +74,19 @@ class BaseCollector(ABC):
             'abstract': abstract or '',
             'authors': authors or [],
             'published_date': published_date,
-            'journal': journal or self.name,
+            # 期刊名在同一批结果中大量重复（如Springer/Elsevier逐条返回），驻留以共享字符串
+            'journal': sys.intern(journal) if journal else self.name,
             'keywords': keywords or [],
             'doi': doi,
             'source_id': self.source_id
         }
     
+    @staticmethod
+    def _raw_stream(response: requests.Response):
+        """返回自动解压gzip/deflate的原始响应流（需以 stream=True 发送请求）"""
+        response.raw.decode_content = True
+        return response.raw
+    
     def _log_collection_start(self, keywords: List[str]) -> None:
         """记录开始收集数据的日志"""
         self.logger.info(f"开始从 {self.name} 收集数据，关键词: {', '.join(keywords)}")
@@ -81,3 +94,36 @@ class BaseCollector(ABC):
     def _log_collection_end(self, count: int) -> None:
         """记录收集数据完成的日志"""
         self.logger.info(f"从 {self.name} 收集数据完成，获取到 {count} 篇文章")
+
+def collect_concurrently(collectors: List[Any],
+                         keywords: List[str],
+                         max_results: int = 10,
+                         max_workers: int = 8) -> List[Dict[str, Any]]:
+    """
+    使用线程池并发执行多个采集器，网络等待时间由累加变为取最大值
+    
+    Args:
+        collectors: 采集器列表（需提供 collect(keywords, max_results) 方法）
+        keywords: 关键词列表
+        max_results: 每个采集器的最大结果数
+        max_workers: 最大并发线程数
+        
+    Returns:
+        List[Dict]: 所有采集器的文章列表，按采集器顺序合并
+    """
+    if not collectors:
+        return []
+    
+    articles = []
+    workers = max(1, min(max_workers, len(collectors)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(c.collect, keywords, max_results) for c in collectors]
+        
+        # 按提交顺序收集结果，单个数据源失败不影响其他数据源
+        for collector, future in zip(collectors, futures):
+            try:
+                articles.extend(future.result())
+            except Exception as e:
+                logger.error(f"从数据源 {collector.source_id} 收集文章失败: {str(e)}")
+    
+    return articles
@@ -2,13 +2,90 @@
 RSS数据源采集器 - 从RSS/Atom源采集文章
 针对Wiley和Science等特殊RSS源进行优化
 """
+import io
+import re
 import feedparser
 import logging
 import time
 import requests
-from datetime import datetime
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
+from ..utils.http_cache import get_http_cache
+from ..utils.http_session import get_session
+from .xml_feed_parser import parse_feed_date, parse_feed_entries
+
+# 摘要字段（按优先级）
+_ABSTRACT_FIELDS = ('summary', 'description', 'content')
+
+# 时间结构体日期字段
+_TIME_STRUCT_FIELDS = ('published_parsed', 'updated_parsed')
+
+# 发布/更新日期的字符串字段
+_PUBLISHED_FIELDS = ('published', 'updated')
+
+# 常见日期格式（RFC 822、ISO 8601），按出现频率排列
+_FAST_DATE_FORMATS = (
+    '%a, %d %b %Y %H:%M:%S %z',
+    '%a, %d %b %Y %H:%M:%S %Z',
+    '%Y-%m-%dT%H:%M:%S%z',
+    '%Y-%m-%d',
+)
+
+# 字符串日期字段
+_DATE_FIELDS = (
+    'dc_date',           # Dublin Core date
+    'published',         # Atom published
+    'pubDate',           # RSS pubDate
+    'updated',           # Atom updated
+    'date',              # 通用date字段
+)
+
+# Wiley源，需要从标题/摘要中提取日期
+_WILEY_SOURCES = frozenset({
+    'advanced_materials',
+    'advanced_functional_materials',
+    'advanced_energy_materials',
+})
+
+# 标题/摘要中的日期模式
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
+def _format_time_struct(time_struct: time.struct_time) -> str:
+    """将时间结构体格式化为 YYYY-MM-DD（直接读取字段，不经过strftime）"""
+    return f"{time_struct.tm_year:04d}-{time_struct.tm_mon:02d}-{time_struct.tm_mday:02d}"
+
+@lru_cache(maxsize=4096)
+def _fast_parse_date(value: Optional[str]) -> Optional[str]:
+    """
+    将订阅源日期字符串快速转换为 YYYY-MM-DD（UTC）
+    
+    先依次尝试常见格式，全部失败时再使用通用的日期解析。
+    同一订阅源的条目常共用相同的日期字符串，结果按字符串缓存，每个不同的值只解析一次
+    
+    Args:
+        value: 日期字符串
+        
+    Returns:
+        str or None: 日期字符串，无法解析时返回None
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    for date_format in _FAST_DATE_FORMATS:
+        try:
+            dt = datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc)
+        return dt.date().isoformat()
+    
+    time_struct = parse_feed_date(value)
+    return _format_time_struct(time_struct) if time_struct else None
+
 class RssCollector:
     """
     RSS采集器，从RSS/Atom源采集文章
@@ -25,6 +102,20 @@ class RssCollector:
         self.source_id = source_id
         self.source_config = source_config
         self.logger = logging.getLogger(__name__)
+        self.session = get_session()
+        self.http_cache = get_http_cache()
+        self._is_wiley = source_id in _WILEY_SOURCES
+        
+        # 发布日期提取方法（按优先级），Wiley源额外尝试从标题/摘要中匹配日期
+        self._date_strategies = tuple(
+            strategy for strategy in (
+                self._date_from_published,
+                self._date_from_str_fields,
+                self._date_from_title_pattern if self._is_wiley else None,
+                self._date_from_tags,
+            ) if strategy is not None
+        )
+        self._date_strategy: Optional[int] = None
         
         # 特殊源的处理配置
         self.special_sources = {
@@ -66,11 +157,17 @@ class RssCollector:
             # 解析RSS源
             self.logger.info(f"开始采集RSS源: {self.source_id} - {url}")
             
-            # 检查是否为特殊源，需要特殊处理
-            if self.source_id in self.special_sources:
-                feed = self._parse_special_source(url)
-            else:
-                feed = feedparser.parse(url)
+            # 所有源统一通过共享会话获取并解析
+            feed = self._fetch_feed(url, max_articles)
+            
+            # 源内容未更新时直接使用缓存的文章
+            if feed.get('status') == 304:
+                cached = self.http_cache.load_articles(url)
+                if cached is not None:
+                    self.logger.info(f"RSS源 {self.source_id} 内容未更新(304)，使用缓存的 {len(cached)} 篇文章")
+                    return cached[:max_articles]
+                self.logger.warning(f"RSS源 {self.source_id} 返回304但缓存已丢失，重新获取")
+                feed = self._fetch_feed(url, max_articles, conditional=False)
             
             # 处理解析警告和错误
             if feed.bozo:
@@ -108,56 +205,94 @@ class RssCollector:
                     continue
             
             self.logger.info(f"从RSS源 {self.source_id} 采集到 {len(articles)} 篇文章")
+            self.http_cache.store(url, feed.get('etag'), feed.get('modified'), articles)
             return articles
             
         except Exception as e:
             self.logger.error(f"采集RSS源 {self.source_id} 失败: {str(e)}")
             return []
     
-    def _parse_special_source(self, url: str):
+    def _headers_for_source(self) -> Dict[str, str]:
         """
-        解析特殊RSS源，使用自定义headers和重试机制
+        获取当前源的请求头，特殊源使用浏览器UA，其余源沿用feedparser的UA
+        
+        Returns:
+            Dict: 请求头
+        """
+        config = self.special_sources.get(self.source_id)
+        if config:
+            return dict(config.get('headers', {}))
+        return {'User-Agent': feedparser.USER_AGENT}
+    
+    def _fetch_feed(self, url: str, max_entries: Optional[int] = None, conditional: bool = True):
+        """
+        通过共享会话获取RSS源并解析，使用按源配置的headers和重试机制
         
         Args:
             url: RSS源URL
+            max_entries: 最多解析的条目数
+            conditional: 是否附带缓存的 ETag/Last-Modified 发送条件请求
             
         Returns:
-            feedparser对象
+            feedparser对象，源内容未更新时 status 为304且没有条目
         """
+        headers = self._headers_for_source()
+        if conditional:
+            headers.update(self.http_cache.conditional_headers(url))
+        
         try:
-            # 获取特殊源配置
-            config = self.special_sources.get(self.source_id, {})
-            headers = config.get('headers', {})
-            
-            # 使用requests先获取内容，再用feedparser解析
-            self.logger.info(f"使用特殊方式解析源: {self.source_id}")
-            
-            session = requests.Session()
-            session.headers.update(headers)
-            
-            # 设置超时和重试
-            response = session.get(url, timeout=30)
+            # 复用共享会话，请求头按请求传入，避免影响其他数据源
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return feedparser.FeedParserDict(status=304, entries=[], bozo=False)
             response.raise_for_status()
             
-            # 使用feedparser解析响应内容
-            feed = feedparser.parse(response.content)
+            # 解析响应内容，并记录校验信息供下次条件请求使用
+            feed = self._parse_content(response.content, max_entries)
+            feed['status'] = response.status_code
+            feed['etag'] = response.headers.get('ETag')
+            feed['modified'] = response.headers.get('Last-Modified')
             
-            self.logger.info(f"特殊源 {self.source_id} 解析完成，获取到 {len(feed.entries) if hasattr(feed, 'entries') else 0} 个条目")
+            self.logger.info(f"RSS源 {self.source_id} 解析完成，获取到 {len(feed.entries) if hasattr(feed, 'entries') else 0} 个条目")
             return feed
             
         except requests.RequestException as e:
-            self.logger.error(f"特殊源 {self.source_id} 网络请求失败: {str(e)}")
-            # 回退到普通解析方式
-            return feedparser.parse(url)
+            self.logger.error(f"RSS源 {self.source_id} 网络请求失败: {str(e)}")
+            # 回退到feedparser自带的获取方式，同样附带条件请求头
+            return feedparser.parse(url, request_headers=headers)
         except Exception as e:
-            self.logger.error(f"特殊源 {self.source_id} 解析失败: {str(e)}")
-            # 回退到普通解析方式
-            return feedparser.parse(url)
+            self.logger.error(f"RSS源 {self.source_id} 解析失败: {str(e)}")
+            # 回退到feedparser自带的获取方式，同样附带条件请求头
+            return feedparser.parse(url, request_headers=headers)
+    
+    def _parse_content(self, content: bytes, max_entries: Optional[int] = None):
+        """
+        解析订阅源内容
+        
+        优先使用lxml逐条提取条目，解析到 max_entries 条后即停止；
+        XML格式有误（如未转义的HTML实体）时回退到容错的feedparser
+        
+        Args:
+            content: 订阅源原始内容
+            max_entries: 最多解析的条目数
+            
+        Returns:
+            feedparser对象
+        """
+        try:
+            entries = parse_feed_entries(io.BytesIO(content), max_entries)
+            return feedparser.FeedParserDict(entries=entries, bozo=False)
+        except SyntaxError as e:
+            self.logger.warning(f"RSS源 {self.source_id} XML解析失败，改用feedparser: {str(e)}")
+        
+        return feedparser.parse(content)
     
     def _extract_article_info(self, entry) -> Optional[Dict[str, Any]]:
         """
         从RSS条目中提取文章信息
         
+        各字段提取均使用 dict.get 和类型检查，只在此处统一捕获异常
+        
         Args:
             entry: RSS条目
             
@@ -165,58 +300,20 @@ class RssCollector:
             Dict: 文章信息字典
         """
         try:
-            # 提取标题
-            title = self._safe_get_attr(entry, 'title', '')
-            
-            # 提取摘要/描述
-            abstract = self._extract_abstract(entry)
-            
-            # 提取URL
-            url = self._safe_get_attr(entry, 'link', '')
-            
-            # 提取发布日期 - 多种方式尝试
-            pub_date = self._extract_publish_date(entry)
-            
-            # 提取作者
-            authors = self._extract_authors(entry)
-            
-            # 提取关键词/标签
-            keywords = self._extract_keywords(entry)
-            
             # 使用 'journal' 字段
-            article = {
-                'title': title,
-                'abstract': abstract,
-                'url': url,
-                'published_date': pub_date,
-                'authors': authors,
-                'keywords': keywords,
+            return {
+                'title': entry.get('title') or '',
+                'abstract': self._extract_abstract(entry),
+                'url': entry.get('link') or '',
+                'published_date': self._extract_publish_date(entry),
+                'authors': self._extract_authors(entry),
+                'keywords': self._extract_keywords(entry),
                 'journal': self.source_id
             }
-            
-            return article
-            
         except Exception as e:
             self.logger.error(f"提取文章信息失败: {str(e)}")
             return None
     
-    def _safe_get_attr(self, obj, attr_name: str, default_value: str = '') -> str:
-        """
-        安全获取对象属性
-        
-        Args:
-            obj: 对象
-            attr_name: 属性名
-            default_value: 默认值
-            
-        Returns:
-            str: 属性值或默认值
-        """
-        try:
-            return getattr(obj, attr_name, default_value) or default_value
-        except Exception:
-            return default_value
-    
     def _extract_abstract(self, entry) -> str:
         """
         提取摘要/描述，尝试多种字段
@@ -227,100 +324,99 @@ class RssCollector:
         Returns:
             str: 摘要内容
         """
-        try:
-            # 按优先级尝试不同的摘要字段
-            abstract_fields = ['summary', 'description', 'content']
-            
-            for field in abstract_fields:
-                abstract = self._safe_get_attr(entry, field, '')
-                if abstract:
-                    # 如果abstract是列表，取第一个元素的value
-                    if isinstance(abstract, list) and len(abstract) > 0:
-                        if hasattr(abstract[0], 'value'):
-                            return abstract[0].value
-                        else:
-                            return str(abstract[0])
-                    elif isinstance(abstract, str):
-                        return abstract
-            
-            return ''
-            
-        except Exception as e:
-            self.logger.warning(f"提取摘要时出错: {str(e)}")
-            return ''
+        # 按优先级尝试不同的摘要字段
+        for field in _ABSTRACT_FIELDS:
+            abstract = entry.get(field)
+            if not abstract:
+                continue
+            # 如果abstract是列表，取第一个元素的value
+            if isinstance(abstract, list):
+                first = abstract[0]
+                value = first.get('value') if isinstance(first, dict) else None
+                return value if value is not None else str(first)
+            if isinstance(abstract, str):
+                return abstract
+        
+        return ''
     
     def _extract_publish_date(self, entry) -> Optional[str]:
         """
         提取发布日期，针对Wiley和Science源进行特殊处理
         
+        同一源的条目格式基本一致，记住上一次成功的方法并优先尝试，
+        失败时再按原优先级尝试其余方法
+        
         Args:
             entry: RSS条目
             
         Returns:
             str: 发布日期字符串
         """
-        try:
-            # 方法1: 尝试解析时间结构体字段
-            time_struct_fields = ['published_parsed', 'updated_parsed']
-            for field in time_struct_fields:
-                time_struct = getattr(entry, field, None)
-                if time_struct:
-                    try:
-                        return time.strftime('%Y-%m-%d', time_struct)
-                    except Exception:
-                        continue
-            
-            # 方法2: 尝试字符串日期字段
-            date_fields = [
-                'dc_date',           # Dublin Core date
-                'published',         # Atom published
-                'pubDate',          # RSS pubDate
-                'updated',          # Atom updated
-                'date',             # 通用date字段
-            ]
-            
-            for field in date_fields:
-                date_value = getattr(entry, field, None)
+        strategies = self._date_strategies
+        learned = self._date_strategy
+        
+        if learned is not None:
+            pub_date = strategies[learned](entry)
+            if pub_date:
+                return pub_date
+        
+        for index, strategy in enumerate(strategies):
+            if index == learned:
+                continue
+            pub_date = strategy(entry)
+            if pub_date:
+                self._date_strategy = index
+                return pub_date
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"无法提取文章发布日期: {entry.get('title', '无标题')}")
+        return None
+    
+    def _date_from_published(self, entry) -> Optional[str]:
+        """方法1: 解析发布/更新日期字段，无法解析时使用feedparser的时间结构体字段"""
+        for field in _PUBLISHED_FIELDS:
+            pub_date = _fast_parse_date(entry.get(field))
+            if pub_date:
+                return pub_date
+        for field in _TIME_STRUCT_FIELDS:
+            time_struct = entry.get(field)
+            if time_struct:
+                return _format_time_struct(time_struct)
+        return None
+    
+    def _date_from_str_fields(self, entry) -> Optional[str]:
+        """方法2: 尝试字符串日期字段"""
+        for field in _DATE_FIELDS:
+            date_value = entry.get(field)
+            if not date_value:
+                continue
+            # 如果是时间结构，转换为字符串
+            if isinstance(date_value, (datetime, date)):
+                return date_value.strftime('%Y-%m-%d')
+            if isinstance(date_value, str):
+                date_value = date_value.strip()
                 if date_value:
-                    # 如果是时间结构，转换为字符串
-                    if hasattr(date_value, 'strftime'):
-                        try:
-                            return date_value.strftime('%Y-%m-%d')
-                        except Exception:
-                            continue
-                    elif isinstance(date_value, str) and date_value.strip():
-                        return date_value.strip()
-            
-            # 方法3: 针对Wiley源的特殊处理
-            if self.source_id in ['advanced_materials', 'advanced_functional_materials', 'advanced_energy_materials']:
-                # 尝试从title或summary中提取日期信息
-                title = getattr(entry, 'title', '')
-                summary = getattr(entry, 'summary', '')
-                
-                # 查找日期模式
-                import re
-                date_pattern = r'(\d{4}-\d{2}-\d{2})'
-                for text in [title, summary]:
-                    if text:
-                        match = re.search(date_pattern, str(text))
-                        if match:
-                            return match.group(1)
-            
-            # 方法4: 从tags中查找日期
-            if hasattr(entry, 'tags'):
-                try:
-                    for tag in entry.tags:
-                        if isinstance(tag, dict) and 'date' in tag.get('term', '').lower():
-                            return tag.get('term')
-                except Exception:
-                    pass
-            
-            self.logger.warning(f"无法提取文章发布日期: {getattr(entry, 'title', '无标题')}")
-            return None
-            
-        except Exception as e:
-            self.logger.warning(f"提取发布日期时出错: {str(e)}")
-            return None
+                    return date_value
+        return None
+    
+    def _date_from_title_pattern(self, entry) -> Optional[str]:
+        """方法3: 针对Wiley源，尝试从title或summary中提取日期信息"""
+        for field in ('title', 'summary'):
+            text = entry.get(field)
+            if isinstance(text, str):
+                match = _DATE_RE.search(text)
+                if match:
+                    return match.group(1)
+        return None
+    
+    def _date_from_tags(self, entry) -> Optional[str]:
+        """方法4: 从tags中查找日期"""
+        for tag in entry.get('tags') or ():
+            if isinstance(tag, dict):
+                term = tag.get('term') or ''
+                if 'date' in term.lower():
+                    return term
+        return None
     
     def _extract_authors(self, entry) -> List[str]:
         """
@@ -334,30 +430,30 @@ class RssCollector:
         """
         authors = []
         
-        try:
-            # 尝试不同的作者字段
-            if hasattr(entry, 'author') and entry.author:
-                authors.append(str(entry.author))
-            elif hasattr(entry, 'authors') and entry.authors:
-                if isinstance(entry.authors, list):
-                    for author in entry.authors:
-                        if isinstance(author, dict):
-                            name = author.get('name', str(author))
-                        else:
-                            name = str(author)
-                        if name:
-                            authors.append(name)
-                else:
-                    authors.append(str(entry.authors))
-            elif hasattr(entry, 'dc_creator') and entry.dc_creator:
-                if isinstance(entry.dc_creator, list):
-                    authors.extend([str(creator) for creator in entry.dc_creator if creator])
-                else:
-                    authors.append(str(entry.dc_creator))
-        except Exception as e:
-            self.logger.warning(f"提取作者信息时出错: {str(e)}")
+        # 尝试不同的作者字段
+        author = entry.get('author')
+        entry_authors = entry.get('authors')
+        dc_creator = entry.get('dc_creator')
+        if author:
+            authors.append(str(author))
+        elif entry_authors:
+            if isinstance(entry_authors, list):
+                for item in entry_authors:
+                    if isinstance(item, dict):
+                        name = item.get('name', str(item))
+                    else:
+                        name = str(item)
+                    if name:
+                        authors.append(name)
+            else:
+                authors.append(str(entry_authors))
+        elif dc_creator:
+            if isinstance(dc_creator, list):
+                authors.extend([str(creator) for creator in dc_creator if creator])
+            else:
+                authors.append(str(dc_creator))
         
-        return [author for author in authors if author.strip()]
+        return [name for name in authors if name.strip()]
     
     def _extract_keywords(self, entry) -> List[str]:
         """
@@ -371,22 +467,19 @@ class RssCollector:
         """
         keywords = []
         
-        try:
-            # 从tags中提取
-            if hasattr(entry, 'tags') and entry.tags:
-                for tag in entry.tags:
-                    if isinstance(tag, dict) and 'term' in tag:
-                        term = tag['term']
-                        if term:
-                            keywords.append(str(term))
-            
-            # 从category中提取
-            if hasattr(entry, 'category') and entry.category:
-                if isinstance(entry.category, list):
-                    keywords.extend([str(cat) for cat in entry.category if cat])
-                else:
-                    keywords.append(str(entry.category))
-        except Exception as e:
-            self.logger.warning(f"提取关键词时出错: {str(e)}")
+        # 从tags中提取
+        for tag in entry.get('tags') or ():
+            if isinstance(tag, dict):
+                term = tag.get('term')
+                if term:
+                    keywords.append(str(term))
+        
+        # 从category中提取
+        category = entry.get('category')
+        if category:
+            if isinstance(category, list):
+                keywords.extend([str(cat) for cat in category if cat])
+            else:
+                keywords.append(str(category))
         
         return [keyword for keyword in keywords if keyword.strip()]
@@ -1,13 +1,38 @@
 """
 网页采集器模块 - 处理网页类型数据源的采集
 """
-import time
 import logging
+import importlib.util
 import requests
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+import soupsieve
 from bs4 import BeautifulSoup
 
 from .base_collector import BaseCollector
+from ..utils.http_session import get_session
+from ..utils.rate_limiter import get_rate_limiter
+
+# 各字段的默认CSS选择器
+_SCIENCEDIRECT_SELECTORS = {
+    'article_container': 'div.result-item',
+    'title': 'h2',
+    'link': 'h2 a',
+    'abstract': 'div.abstract-text',
+    'authors': 'div.Authors',
+    'date': 'div.publication-date',
+}
+_GENERIC_SELECTORS = {
+    'article_container': 'div.article',
+    'title': 'h2',
+    'link': 'a',
+    'abstract': 'div.abstract',
+    'authors': 'div.authors',
+    'date': 'div.date',
+}
+
+# BeautifulSoup解析后端：优先使用C实现的lxml，未安装时回退到标准库html.parser
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
 
 class WebCollector(BaseCollector):
     """
@@ -28,6 +53,19 @@ class WebCollector(BaseCollector):
         self.rate_limit = source_config.get('rate_limit', 1)  # 默认每秒1次请求
         self.headers = source_config.get('headers', {})
         self.selectors = source_config.get('selectors', {})
+        # 预编译各字段的CSS选择器，避免每个结果容器重复查找和编译
+        default_selectors = _SCIENCEDIRECT_SELECTORS if source_id == 'sciencedirect' else _GENERIC_SELECTORS
+        self._compiled_selectors = {
+            field: soupsieve.compile(self.selectors.get(field, default))
+            for field, default in default_selectors.items()
+        }
+        self.session = get_session()
+        # 并发采集时同一主机的网页源共享令牌桶，避免同时请求同一网站
+        self.rate_limiter = get_rate_limiter(
+            urlparse(self.base_url).netloc,
+            self.rate_limit,
+            source_config.get('burst')
+        )
     
     def collect(self, keywords: List[str], max_results: int = 10) -> List[Dict[str, Any]]:
         """
@@ -66,37 +104,41 @@ class WebCollector(BaseCollector):
         
         try:
             # 发送请求
-            response = requests.get(self.base_url, params=params, headers=self.headers)
-            response.raise_for_status()
-            
-            # 解析HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            self._respect_rate_limit()
+            # 复用共享会话的连接池，请求头按请求传入，避免影响其他数据源
+            with self.session.get(self.base_url, params=params, headers=self.headers,
+                                  timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                # 解析HTML：直接从响应流读取原始字节，由lxml完成编码检测
+                soup = BeautifulSoup(self._raw_stream(response), _HTML_PARSER)
             
-            # 提取文章信息
-            article_containers = soup.select(self.selectors.get('article_container', 'div.result-item'))
+            # 提取文章信息，找到 max_results 个容器后停止匹配
+            selectors = self._compiled_selectors
+            article_containers = selectors['article_container'].select(soup, limit=max_results)
             
-            for container in article_containers[:max_results]:
+            for container in article_containers:
                 # 提取标题
-                title_elem = container.select_one(self.selectors.get('title', 'h2'))
+                title_elem = selectors['title'].select_one(container)
                 title = title_elem.text.strip() if title_elem else ''
                 
                 # 提取链接
-                link_elem = container.select_one(self.selectors.get('link', 'h2 a'))
+                link_elem = selectors['link'].select_one(container)
                 url = link_elem.get('href', '') if link_elem else ''
                 if url and not url.startswith('http'):
                     url = 'https://www.sciencedirect.com' + url
                 
                 # 提取摘要
-                abstract_elem = container.select_one(self.selectors.get('abstract', 'div.abstract-text'))
+                abstract_elem = selectors['abstract'].select_one(container)
                 abstract = abstract_elem.text.strip() if abstract_elem else ''
                 
                 # 提取作者
-                authors_elem = container.select_one(self.selectors.get('authors', 'div.Authors'))
+                authors_elem = selectors['authors'].select_one(container)
                 authors_text = authors_elem.text.strip() if authors_elem else ''
                 authors = [a.strip() for a in authors_text.split(',') if a.strip()]
                 
                 # 提取日期
-                date_elem = container.select_one(self.selectors.get('date', 'div.publication-date'))
+                date_elem = selectors['date'].select_one(container)
                 published_date = date_elem.text.strip() if date_elem else None
                 
                 # 创建文章字典
@@ -136,35 +178,39 @@ class WebCollector(BaseCollector):
         
         try:
             # 发送请求
-            response = requests.get(self.base_url, params=params, headers=self.headers)
-            response.raise_for_status()
-            
-            # 解析HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            self._respect_rate_limit()
+            # 复用共享会话的连接池，请求头按请求传入，避免影响其他数据源
+            with self.session.get(self.base_url, params=params, headers=self.headers,
+                                  timeout=30, stream=True) as response:
+                response.raise_for_status()
+                
+                # 解析HTML：直接从响应流读取原始字节，由lxml完成编码检测
+                soup = BeautifulSoup(self._raw_stream(response), _HTML_PARSER)
             
-            # 提取文章信息
-            article_containers = soup.select(self.selectors.get('article_container', 'div.article'))
+            # 提取文章信息，找到 max_results 个容器后停止匹配
+            selectors = self._compiled_selectors
+            article_containers = selectors['article_container'].select(soup, limit=max_results)
             
-            for container in article_containers[:max_results]:
+            for container in article_containers:
                 # 提取标题
-                title_elem = container.select_one(self.selectors.get('title', 'h2'))
+                title_elem = selectors['title'].select_one(container)
                 title = title_elem.text.strip() if title_elem else ''
                 
                 # 提取链接
-                link_elem = container.select_one(self.selectors.get('link', 'a'))
+                link_elem = selectors['link'].select_one(container)
                 url = link_elem.get('href', '') if link_elem else ''
                 
                 # 提取摘要
-                abstract_elem = container.select_one(self.selectors.get('abstract', 'div.abstract'))
+                abstract_elem = selectors['abstract'].select_one(container)
                 abstract = abstract_elem.text.strip() if abstract_elem else ''
                 
                 # 提取作者
-                authors_elem = container.select_one(self.selectors.get('authors', 'div.authors'))
+                authors_elem = selectors['authors'].select_one(container)
                 authors_text = authors_elem.text.strip() if authors_elem else ''
                 authors = [a.strip() for a in authors_text.split(',') if a.strip()]
                 
                 # 提取日期
-                date_elem = container.select_one(self.selectors.get('date', 'div.date'))
+                date_elem = selectors['date'].select_one(container)
                 published_date = date_elem.text.strip() if date_elem else None
                 
                 # 创建文章字典
@@ -188,6 +234,5 @@ class WebCollector(BaseCollector):
             return []
     
     def _respect_rate_limit(self) -> None:
-        """遵循网站速率限制"""
-        if self.rate_limit > 0:
-            time.sleep(1.0 / self.rate_limit)
+        """遵循网站速率限制（按主机共享的令牌桶）"""
+        self.rate_limiter.acquire()
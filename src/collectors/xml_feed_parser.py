@@ -0,0 +1,224 @@
+"""
+XML订阅源解析模块 - 基于lxml的轻量RSS/Atom条目提取
+
+逐条流式解析RSS 1.0/2.0、Atom订阅源，只提取采集所需的字段，
+跳过feedparser的通用清洗和规范化步骤（HTML字段由 utils.html_sanitizer 按白名单清理）。
+输出的条目字典使用与feedparser相同的键名，RssCollector的字段提取方法可以直接复用。
+"""
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from html import escape
+from typing import Dict, Any, List, Optional
+
+from ..utils.html_sanitizer import sanitize_html
+
+try:
+    from lxml import etree
+    _IS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    _IS_LXML = False
+
+# 命名空间
+_ATOM_NS = 'http://www.w3.org/2005/Atom'
+_CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+
+# 条目元素的本地名（RSS为item，Atom为entry）
+_ENTRY_NAMES = frozenset({'item', 'entry'})
+
+# 发布日期/更新日期元素的本地名
+_PUBLISHED_NAMES = frozenset({'pubDate', 'published', 'issued', 'date', 'publicationDate'})
+_UPDATED_NAMES = frozenset({'updated', 'modified'})
+
+def _split_tag(tag: str):
+    """将Clark记法的标签拆分为(命名空间, 本地名)"""
+    if tag[0] == '{':
+        namespace, _, local = tag[1:].partition('}')
+        return namespace, local
+    return '', tag
+
+def _element_text(element) -> str:
+    """获取元素的完整文本（包括子元素，如Atom的xhtml内容）"""
+    if len(element):
+        return ''.join(element.itertext()).strip()
+    return (element.text or '').strip()
+
+def _inner_markup(element) -> str:
+    """将元素的子节点序列化为HTML片段（去掉命名空间，用于Atom的xhtml内容）"""
+    parts = [escape(element.text or '', quote=False)]
+    for child in element:
+        if isinstance(child.tag, str):
+            local = _split_tag(child.tag)[1]
+            attrs = ''.join(f' {_split_tag(name)[1]}="{escape(value)}"' for name, value in child.attrib.items())
+            parts.append(f'<{local}{attrs}>{_inner_markup(child)}</{local}>')
+        parts.append(escape(child.tail or '', quote=False))
+    return ''.join(parts)
+
+def _sanitize(value: str) -> str:
+    """按白名单清理HTML，去除script、事件属性等不安全内容（文本中的 & 与feedparser一样保持原样）"""
+    if '<' not in value:
+        # 不含标签的纯文本无需清理
+        return value
+    return sanitize_html(value, escape_ampersand=False).strip()
+
+def _html_text(element, namespace: str) -> str:
+    """
+    获取可能包含HTML的字段（标题、摘要、正文）的内容，按白名单清理不安全的标记
+
+    Atom元素按type属性区分：xhtml保留子元素标记，html按转义后的HTML处理，text（默认）为纯文本；
+    RSS的description/content:encoded均按HTML处理
+
+    Args:
+        element: 字段元素
+        namespace: 元素的命名空间
+
+    Returns:
+        str: 清理后的内容
+    """
+    if namespace == _ATOM_NS:
+        content_type = element.get('type', 'text')
+        if 'xhtml' in content_type:
+            # xhtml内容包裹在一个div中，只取div内部的标记
+            wrapper = element[0] if len(element) == 1 and _split_tag(element[0].tag)[1] == 'div' else element
+            return _sanitize(_inner_markup(wrapper).strip())
+        if 'html' not in content_type:
+            return _element_text(element)
+    return _sanitize(_element_text(element))
+
+def parse_feed_date(value: Optional[str]) -> Optional[time.struct_time]:
+    """
+    解析RFC 822 / ISO 8601格式的日期，返回UTC时间结构体（与feedparser的 *_parsed 字段一致）
+
+    Args:
+        value: 日期字符串
+
+    Returns:
+        time.struct_time or None: 解析失败时返回None
+    """
+    if not value:
+        return None
+
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.timetuple()
+
+def _entry_from_element(element) -> Dict[str, Any]:
+    """
+    将一个item/entry元素转换为feedparser风格的条目字典
+
+    日期只保留原始字符串，由调用方按需解析（不生成 *_parsed 字段）；
+    标题、摘要和正文中的HTML按白名单清理
+
+    Args:
+        element: item/entry元素
+
+    Returns:
+        Dict: 条目字典
+    """
+    entry: Dict[str, Any] = {}
+    authors: List[Dict[str, str]] = []
+    tags: List[Dict[str, str]] = []
+
+    for child in element:
+        tag = child.tag
+        if not isinstance(tag, str):
+            # 跳过注释和处理指令
+            continue
+
+        namespace, local = _split_tag(tag)
+
+        if local == 'title':
+            entry.setdefault('title', _html_text(child, namespace))
+        elif local == 'link':
+            if namespace == _ATOM_NS:
+                if child.get('rel', 'alternate') == 'alternate' and child.get('href'):
+                    entry.setdefault('link', child.get('href'))
+            elif child.text:
+                entry.setdefault('link', child.text.strip())
+        elif local in ('description', 'summary', 'abstract'):
+            entry.setdefault('summary', _html_text(child, namespace))
+        elif (local == 'content' and namespace in ('', _ATOM_NS)) or (local == 'encoded' and namespace == _CONTENT_NS):
+            # 只接受Atom/RSS的正文元素（不含 media:content 等其他命名空间的同名元素）；
+            # 空值不占位，之后的 content:encoded 等仍可提供正文
+            value = _html_text(child, namespace)
+            if value and not entry.get('content'):
+                entry['content'] = [{'value': value}]
+        elif local == 'creator':
+            name = _element_text(child)
+            if name:
+                authors.append({'name': name})
+        elif local == 'author':
+            # Atom作者包含name子元素，RSS作者为纯文本
+            name_element = child.find(f'{{{_ATOM_NS}}}name') if namespace == _ATOM_NS else None
+            name = _element_text(name_element if name_element is not None else child)
+            if name:
+                authors.append({'name': name})
+        elif local in ('subject', 'category'):
+            term = child.get('term') or _element_text(child)
+            if term:
+                tags.append({'term': term})
+        elif local in _PUBLISHED_NAMES:
+            entry.setdefault('published', _element_text(child))
+        elif local in _UPDATED_NAMES:
+            entry.setdefault('updated', _element_text(child))
+        elif local == 'id' or local == 'guid':
+            entry.setdefault('id', _element_text(child))
+
+    if 'link' not in entry and entry.get('id', '').startswith('http'):
+        entry['link'] = entry['id']
+    if authors:
+        entry['authors'] = authors
+    if tags:
+        entry['tags'] = tags
+
+    return entry
+
+def parse_feed_entries(source, max_entries: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    逐条解析订阅源中的item/entry元素，处理完即释放
+
+    Args:
+        source: 文件路径或可读的文件对象
+        max_entries: 最多解析的条目数，达到后不再解析剩余内容
+
+    Returns:
+        List[Dict]: 条目字典列表
+
+    Raises:
+        SyntaxError: XML格式错误时抛出（lxml.etree.XMLSyntaxError 与 ElementTree.ParseError 均为其子类）
+    """
+    if _IS_LXML:
+        # 不解析外部实体，避免XXE
+        events = etree.iterparse(source, events=('end',), resolve_entities=False, no_network=True)
+    else:
+        events = etree.iterparse(source, events=('end',))
+
+    entries = []
+    if max_entries is not None and max_entries <= 0:
+        return entries
+
+    for _, element in events:
+        tag = element.tag
+        if not isinstance(tag, str) or _split_tag(tag)[1] not in _ENTRY_NAMES:
+            continue
+
+        entries.append(_entry_from_element(element))
+        if max_entries is not None and len(entries) >= max_entries:
+            break
+
+        # 释放已处理的条目及其前序兄弟节点
+        element.clear()
+        if _IS_LXML:
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    return entries
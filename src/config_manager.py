@@ -4,7 +4,27 @@
 import os
 import yaml
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        # 日期等类型交给default处理（即抛出TypeError），保证只缓存能原样还原的配置
+        return orjson.dumps(data, option=orjson.OPT_PASSTHROUGH_DATETIME)
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+# 优先使用libyaml的C实现加载器，未编译libyaml时回退到纯Python实现
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# YAML解析结果的JSON缓存文件后缀（与YAML文件位于同一目录）
+_JSON_CACHE_SUFFIX = '.cache.json'
 
 class ConfigManager:
     """配置管理类，负责加载和管理配置"""
@@ -21,6 +41,9 @@ class ConfigManager:
         self.journals: Dict[str, Any] = {}
         self.keywords: Dict[str, Any] = {}
         self.logger = logging.getLogger(__name__)
+        # 已解析的YAML文件：路径 -> ((修改时间ns, 文件大小), 内容)，文件未修改时重新加载直接复用
+        self._yaml_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        self._all_sources: Optional[Dict[str, Dict[str, Any]]] = None
         
     def load_all_configs(self) -> bool:
         """
@@ -37,6 +60,7 @@ class ConfigManager:
             # 加载期刊配置
             journals_path = os.path.join(self.config_dir, 'journals.yaml')
             self.journals = self._load_yaml(journals_path)
+            self._all_sources = None
             
             # 加载关键词配置
             keywords_path = os.path.join(self.config_dir, 'keywords.yaml')
@@ -51,7 +75,10 @@ class ConfigManager:
     
     def _load_yaml(self, file_path: str) -> Dict[str, Any]:
         """
-        加载YAML配置文件
+        加载YAML配置文件，文件修改时间和大小未变化时返回上次的解析结果
+        
+        同目录下的JSON缓存记录了生成时YAML文件的修改时间（纳秒）和大小，
+        两者与当前文件完全一致时直接读取JSON，跳过YAML解析
         
         Args:
             file_path: YAML文件路径
@@ -66,11 +93,55 @@ class ConfigManager:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"配置文件不存在: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as file:
-            try:
-                return yaml.safe_load(file) or {}
-            except yaml.YAMLError as e:
-                raise yaml.YAMLError(f"解析YAML文件失败 {file_path}: {str(e)}")
+        # 以修改时间和大小标识文件版本；不比较新旧，保留原修改时间部署的旧版本文件也能识别为已变化
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._yaml_cache.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        cache_path = os.path.splitext(file_path)[0] + _JSON_CACHE_SUFFIX
+        data = self._load_json_cache(cache_path, signature)
+        if data is None:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                try:
+                    data = yaml.load(file, Loader=_YAML_LOADER) or {}
+                except yaml.YAMLError as e:
+                    raise yaml.YAMLError(f"解析YAML文件失败 {file_path}: {str(e)}")
+            self._write_json_cache(cache_path, signature, data)
+        
+        self._yaml_cache[file_path] = (signature, data)
+        return data
+    
+    def _load_json_cache(self, cache_path: str, signature: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """读取JSON缓存，缓存不存在、记录的YAML修改时间/大小与当前文件不一致或已损坏时返回None"""
+        try:
+            with open(cache_path, 'rb') as file:
+                entry = _json_loads(file.read())
+            if not isinstance(entry, dict) or entry.get('source') != [signature[0], signature[1]]:
+                return None
+            return entry.get('data')
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"读取配置缓存失败 {cache_path}: {str(e)}")
+            return None
+    
+    def _write_json_cache(self, cache_path: str, signature: Tuple[int, int], data: Dict[str, Any]) -> None:
+        """写入JSON缓存及对应YAML文件的修改时间/大小，配置中含有JSON无法原样表示的值（如日期、非字符串键）时不缓存"""
+        try:
+            entry = {'source': [signature[0], signature[1]], 'data': data}
+            content = _json_dumps(entry)
+            if _json_loads(content) != entry:
+                return
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'wb') as file:
+                file.write(content)
+            os.replace(tmp_path, cache_path)
+        except TypeError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"写入配置缓存失败 {cache_path}: {str(e)}")
     
     def _setup_logging(self) -> None:
         """设置日志配置"""
@@ -78,8 +149,10 @@ class ConfigManager:
         log_level = getattr(logging, log_config.get('level', 'INFO'))
         log_file = log_config.get('file', 'app.log')
         
-        # 确保日志目录存在
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        # 确保日志目录存在（日志文件位于当前目录时无需创建）
+        log_dir = os.path.dirname(log_file)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
         
         logging.basicConfig(
             level=log_level,
@@ -127,12 +200,14 @@ class ConfigManager:
         return self.journals.get('web_sources', {})
     
     def get_all_sources(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有数据源配置"""
-        all_sources = {}
-        all_sources.update(self.get_api_sources())
-        all_sources.update(self.get_rss_sources())
-        all_sources.update(self.get_web_sources())
-        return all_sources
+        """获取所有数据源配置（合并结果在重新加载期刊配置前保持不变）"""
+        if self._all_sources is None:
+            all_sources = {}
+            all_sources.update(self.get_api_sources())
+            all_sources.update(self.get_rss_sources())
+            all_sources.update(self.get_web_sources())
+            self._all_sources = all_sources
+        return self._all_sources
     
     def get_source_config(self, source_id: str) -> Optional[Dict[str, Any]]:
         """
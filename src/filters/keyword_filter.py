@@ -2,6 +2,14 @@ import re
 import logging
 from typing import Dict, Any, List
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 匹配结果缓存的最大条目数
+_MATCH_CACHE_SIZE = 10000
+
 class KeywordFilter:
     """
     关键词过滤器，根据配置的关键词过滤文章
@@ -24,13 +32,43 @@ class KeywordFilter:
         self.include_fields = matching_config.get('include_fields', ['title', 'abstract', 'keywords'])
         self.logger = logging.getLogger(__name__)
 
+        # 同一文章可能由多个数据源重复采集，按文章标识缓存匹配结果
+        self._match_cache: Dict[Any, bool] = {}
+
         # 预编译正则表达式（如需要）
         if self.match_type == 'regex':
             flags = 0 if self.case_sensitive else re.IGNORECASE
-            self.compiled_patterns = [re.compile(k, flags) for k in self.keywords]
+            self.compiled_patterns = [re.compile(k, flags) for k in dict.fromkeys(self.keywords)]
         else:
             self.compiled_patterns = None
 
+        # 大小写不敏感时搜索文本会统一转为小写（正则匹配使用IGNORECASE），关键词只需转换一次；同时按顺序去重
+        self._lower_text = not self.case_sensitive and self.match_type != 'regex'
+        if self.case_sensitive:
+            self._keywords = tuple(dict.fromkeys(self.keywords))
+        else:
+            self._keywords = tuple(dict.fromkeys(k.lower() for k in self.keywords))
+
+        # 整词匹配：match_any 使用合并后的单个正则一次扫描，match_all 使用逐个关键词的正则
+        if self.whole_word and self.match_type in ('exact', 'contain') and self._keywords:
+            escaped = [re.escape(k) for k in self._keywords]
+            self._whole_word_combined = re.compile(r'\b(?:' + '|'.join(escaped) + r')\b')
+            self._whole_word_patterns = [re.compile(r'\b' + k + r'\b') for k in escaped]
+        else:
+            self._whole_word_combined = None
+            self._whole_word_patterns = None
+
+        # 子串匹配：安装了pyahocorasick时构建自动机，一次扫描即可找出所有关键词
+        self._automaton = None
+        if (ahocorasick is not None and self.match_type == 'contain' and not self.whole_word
+                and self._keywords and all(self._keywords)):
+            # 每个关键词对应一个比特位，match_all 时所有位都置1即为全部命中
+            self._automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(self._keywords):
+                self._automaton.add_word(keyword, 1 << index)
+            self._automaton.make_automaton()
+            self._all_mask = (1 << len(self._keywords)) - 1
+
     def filter_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         过滤文章列表，保留包含关键词的文章
@@ -42,64 +80,99 @@ class KeywordFilter:
             List[Dict]: 过滤后的文章列表
         """
         filtered_articles = []
+        cache = self._match_cache
 
         for article in articles:
-            if self._article_matches_keywords(article):
+            identifier = article.get('doi') or article.get('url')
+            if not identifier:
+                matched = self._article_matches_keywords(article)
+            else:
+                key = (identifier, article.get('title'))
+                matched = cache.get(key)
+                if matched is None:
+                    matched = self._article_matches_keywords(article)
+                    if len(cache) < _MATCH_CACHE_SIZE:
+                        cache[key] = matched
+            if matched:
                 filtered_articles.append(article)
 
         self.logger.info(f"关键词过滤: 从 {len(articles)} 篇文章中过滤得到 {len(filtered_articles)} 篇")
         return filtered_articles
 
-    def _article_matches_keywords(self, article: Dict[str, Any]) -> bool:
+    def _article_search_text(self, article: Dict[str, Any]) -> str:
         """
-        检查文章是否匹配关键词
+        构建文章的搜索文本，大小写不敏感的非正则匹配会统一转为小写
 
         Args:
             article: 文章数据
 
         Returns:
-            bool: 是否匹配
+            str: 搜索文本
         """
-        # 构建要搜索的文本
-        search_text = ""
+        # 收集各字段后一次拼接，避免逐段拼接产生中间字符串
+        parts = []
         for field in self.include_fields:
             if field in article:
-                if isinstance(article[field], list):
-                    search_text += " ".join(article[field]) + " "
+                value = article[field]
+                if isinstance(value, list):
+                    parts.append(" ".join(value))
                 else:
-                    search_text += str(article[field]) + " "
+                    parts.append(str(value))
+        search_text = " ".join(parts)
+        return search_text.lower() if self._lower_text else search_text
+
+    def _article_matches_keywords(self, article: Dict[str, Any]) -> bool:
+        """
+        检查文章是否匹配关键词
+
+        Args:
+            article: 文章数据
 
-        # 匹配方式分支
+        Returns:
+            bool: 是否匹配
+        """
+        return self._text_matches_keywords(self._article_search_text(article))
+
+    def _text_matches_keywords(self, search_text: str) -> bool:
+        """
+        检查搜索文本是否匹配关键词
+
+        Args:
+            search_text: 由 _article_search_text 构建的搜索文本
+
+        Returns:
+            bool: 是否匹配
+        """
+        # 匹配方式分支（使用生成器，match_any 命中即停止，match_all 未命中即停止）
         if self.match_type == 'regex':
-            matches = [bool(p.search(search_text)) for p in self.compiled_patterns]
+            matches = (p.search(search_text) for p in self.compiled_patterns)
         else:
-            # 处理大小写
-            if not self.case_sensitive:
-                search_text = search_text.lower()
-                keywords = [k.lower() for k in self.keywords]
+            keywords = self._keywords
+
+            # 整词匹配使用预编译的正则
+            if self._whole_word_patterns is not None:
+                if self.match_any:
+                    return self._whole_word_combined.search(search_text) is not None
+                return all(p.search(search_text) for p in self._whole_word_patterns)
+
+            # 子串匹配使用Aho-Corasick自动机
+            if self._automaton is not None:
+                if self.match_any:
+                    return next(self._automaton.iter(search_text), None) is not None
+                seen = 0
+                for _, bit in self._automaton.iter(search_text):
+                    seen |= bit
+                    if seen == self._all_mask:
+                        return True
+                return False
+
+            if self.match_type == 'exact':
+                # 全等匹配
+                stripped_text = search_text.strip()
+                matches = (keyword == stripped_text for keyword in keywords)
             else:
-                keywords = self.keywords
-
-            matches = []
-            for keyword in keywords:
-                if self.match_type == 'exact':
-                    # 全等匹配
-                    if self.whole_word:
-                        pattern = r'\b' + re.escape(keyword) + r'\b'
-                        match = re.search(pattern, search_text)
-                        matches.append(bool(match))
-                    else:
-                        matches.append(keyword == search_text.strip())
-                elif self.match_type == 'contain':
-                    if self.whole_word:
-                        pattern = r'\b' + re.escape(keyword) + r'\b'
-                        match = re.search(pattern, search_text)
-                        matches.append(bool(match))
-                    else:
-                        matches.append(keyword in search_text)
-                else:
-                    # 默认包含关系
-                    matches.append(keyword in search_text)
+                # contain及默认均为包含关系
+                matches = (keyword in search_text for keyword in keywords)
 
         # 根据匹配模式返回结果
         if self.match_any:
@@ -5,23 +5,25 @@ import os
 import sys
 import logging
 import argparse
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Any, List, Optional
 
 # 添加src目录到Python路径
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config_manager import ConfigManager
+from src.collectors.base_collector import collect_concurrently
 from src.collectors.api_collector import ApiCollector
 from src.collectors.rss_collector import RssCollector
 from src.collectors.web_collector import WebCollector
 from src.filters.keyword_filter import KeywordFilter
 from src.storage.article_storage import ArticleStorage
 from src.notifiers.email_notifier import EmailNotifier
+from src.utils.http_cache import DEFAULT_CACHE_DIR, configure_http_cache
 
-def filter_yesterday_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def make_yesterday_filter() -> Callable[[Dict[str, Any]], bool]:
     """
-    只保留昨天发布的文章，兼容多种日期格式。
+    创建判断文章是否为昨天发布的函数，兼容多种日期格式。
     """
     try:
         from dateutil.parser import parse as date_parse
@@ -29,35 +31,55 @@ def filter_yesterday_articles(articles: List[Dict[str, Any]]) -> List[Dict[str,
         raise ImportError("请先安装 python-dateutil 包：pip install python-dateutil")
 
     yesterday = (datetime.now() - timedelta(days=1)).date()
-    filtered = []
+    yesterday_str = yesterday.isoformat()
+    # 同一批文章的日期字符串大量重复（同一源常共用发布日期），每个不同的字符串只解析一次
+    parsed_dates: Dict[str, Optional[date]] = {}
 
-    for article in articles:
+    def is_published_yesterday(article: Dict[str, Any]) -> bool:
         pub_date = article.get('published_date')
-        pub_date_obj = None
 
         if pub_date is None:
-            continue
+            return False
 
         # 1. 直接是 datetime 类型
         if isinstance(pub_date, datetime):
             pub_date_obj = pub_date.date()
         # 2. 是字符串，尝试多种格式解析
         elif isinstance(pub_date, str):
-            try:
-                pub_date_obj = date_parse(pub_date).date()
-            except Exception:
+            # 快速路径：以 YYYY-MM-DD 开头的日期直接比较前缀，无需解析
+            if pub_date[:10] == yesterday_str:
+                return True
+            if pub_date in parsed_dates:
+                pub_date_obj = parsed_dates[pub_date]
+            else:
+                try:
+                    # ISO 8601 使用C实现的fromisoformat，其余格式再交给通用的dateutil
+                    pub_date_obj = datetime.fromisoformat(pub_date.replace('Z', '+00:00')).date()
+                except ValueError:
+                    try:
+                        pub_date_obj = date_parse(pub_date).date()
+                    except Exception:
+                        pub_date_obj = None
+                parsed_dates[pub_date] = pub_date_obj
+            if pub_date_obj is None:
                 # 如果解析失败，跳过
-                continue
+                return False
         else:
-            continue
+            return False
 
         # 可选：调试时输出每篇文章的日期解析结果
         # print(f"解析到文章日期: {pub_date} -> {pub_date_obj}，标题: {article.get('title')}")
 
-        if pub_date_obj == yesterday:
-            filtered.append(article)
+        return pub_date_obj == yesterday
 
-    return filtered
+    return is_published_yesterday
+
+def filter_yesterday_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    只保留昨天发布的文章，兼容多种日期格式。
+    """
+    is_published_yesterday = make_yesterday_filter()
+    return [article for article in articles if is_published_yesterday(article)]
 
 # def debug_article_dates(articles: List[Dict[str, Any]], source_name: str):
 #     """
@@ -91,6 +113,8 @@ def main():
     # 获取配置目录的绝对路径
     config_dir = os.path.abspath(args.config_dir)
     
+    # 存储创建后持有数据库连接，无论程序如何结束都需要关闭
+    article_storage = None
     try:
         # 加载配置
         config_manager = ConfigManager(config_dir)
@@ -111,6 +135,9 @@ def main():
         # 清理过期文章
         article_storage.cleanup_old_articles()
         
+        # 配置HTTP条件请求缓存
+        configure_http_cache(storage_config.get('http_cache_dir', DEFAULT_CACHE_DIR))
+        
         # 获取关键词
         keywords = config_manager.get_keywords()
         if not keywords:
@@ -132,47 +159,22 @@ def main():
         # 收集所有文章
         all_articles = []
         
-        # 从API源收集文章
-        for source_id, source_config in api_sources.items():
-            try:
-                collector = ApiCollector(source_id, source_config)
-                articles = collector.collect(keywords, max_articles_per_source)
-                
-                # 调试API源文章日期
-                # if args.debug_dates:
-                #     debug_article_dates(articles, f"API-{source_id}")
-                
-                all_articles.extend(articles)
-            except Exception as e:
-                logging.error(f"从API源 {source_id} 收集文章失败: {str(e)}")
-        
-        # 从RSS源收集文章
-        for source_id, source_config in rss_sources.items():
-            try:
-                collector = RssCollector(source_id, source_config)
-                articles = collector.collect(keywords, max_articles_per_source)
-                
-                # 调试RSS源文章日期
-                # if args.debug_dates:
-                #     debug_article_dates(articles, f"RSS-{source_id}")
-                
-                all_articles.extend(articles)
-            except Exception as e:
-                logging.error(f"从RSS源 {source_id} 收集文章失败: {str(e)}")
-        
-        # 从网页源收集文章
-        for source_id, source_config in web_sources.items():
-            try:
-                collector = WebCollector(source_id, source_config)
-                articles = collector.collect(keywords, max_articles_per_source)
-                
-                # 调试网页源文章日期
-                # if args.debug_dates:
-                #     debug_article_dates(articles, f"WEB-{source_id}")
-                
-                all_articles.extend(articles)
-            except Exception as e:
-                logging.error(f"从网页源 {source_id} 收集文章失败: {str(e)}")
+        # 初始化所有数据源的采集器
+        collectors = []
+        for source_type, collector_class, sources in (
+            ('API源', ApiCollector, api_sources),
+            ('RSS源', RssCollector, rss_sources),
+            ('网页源', WebCollector, web_sources),
+        ):
+            for source_id, source_config in sources.items():
+                try:
+                    collectors.append(collector_class(source_id, source_config))
+                except Exception as e:
+                    logging.error(f"初始化{source_type} {source_id} 失败: {str(e)}")
+        
+        # 所有数据源在同一个线程池中并发收集，总耗时取决于最慢的数据源；
+        # 同一主机的请求由共享令牌桶限速
+        all_articles.extend(collect_concurrently(collectors, keywords, max_articles_per_source, max_workers=16))
         
         logging.info(f"总共收集到 {len(all_articles)} 篇文章")
         
@@ -189,12 +191,8 @@ def main():
         #     print(f"   发布时间: {pub_date}")
         #     print("-" * 80)
         
-        # 只保留昨天的文章
-        yesterday_articles = filter_yesterday_articles(filtered_articles)
-        logging.info(f"仅保留昨天的文章后剩余 {len(yesterday_articles)} 篇文章")
-        
-        # 保存文章并去重
-        new_articles = article_storage.save_articles(yesterday_articles)
+        # 只保存昨天发布的文章并去重（日期判断在保存时逐篇进行，无需单独遍历一次）
+        new_articles = article_storage.save_articles(filtered_articles, accept=make_yesterday_filter())
         logging.info(f"去重后有 {len(new_articles)} 篇新文章")
         
         # 发送邮件部分 
@@ -208,8 +206,12 @@ def main():
             # 限制邮件中的文章数量
             articles_to_send = new_articles[:max_articles_per_email]
             
-            # 发送邮件
-            if email_notifier.send_articles_email(articles_to_send):
+            # 发送邮件，无论是否出错都结束SMTP会话
+            try:
+                email_sent = email_notifier.send_articles_email(articles_to_send)
+            finally:
+                email_notifier.close()
+            if email_sent:
                 # 标记文章为已发送
                 article_urls = [article['url'] for article in articles_to_send]
                 article_storage.mark_articles_as_sent(article_urls)
@@ -227,6 +229,9 @@ def main():
     except Exception as e:
         logging.exception(f"程序运行出错: {str(e)}")
         return 1
+    finally:
+        if article_storage is not None:
+            article_storage.close()
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -3,68 +3,35 @@
 """
 import smtplib
 import logging
+import jinja2
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from markupsafe import Markup
 from typing import Dict, Any, List, Optional
 import os
 
-class EmailNotifier:
-    """
-    邮件通知器，负责生成和发送邮件通知
+from ..utils.html_sanitizer import INLINE_TAGS, sanitize_html
+
+def _inline_html(value: Optional[str]) -> Markup:
     """
+    模板过滤器：清理订阅源提供的标题/摘要，只保留白名单行内标签
     
-    def __init__(self, email_config: Dict[str, Any]):
-        """
-        初始化邮件通知器
-        
-        Args:
-            email_config: 邮件配置
-        """
-        self.sender = os.environ.get('EMAIL_SENDER', email_config.get('sender', ''))
-        self.password = os.environ.get('EMAIL_PASSWORD', email_config.get('password', ''))
-        self.recipients = email_config.get('recipients', [])
-        self.smtp_server = email_config.get('smtp_server', '')
-        self.smtp_port = email_config.get('smtp_port', 587)
-        self.use_tls = email_config.get('use_tls', True)
-        self.logger = logging.getLogger(__name__)
-    
-    def send_articles_email(self, articles: List[Dict[str, Any]], subject: Optional[str] = None) -> bool:
-        """
-        发送包含文章列表的邮件
-        
-        Args:
-            articles: 文章列表
-            subject: 邮件主题，默认为自动生成
-            
-        Returns:
-            bool: 是否发送成功
-        """
-        if not articles:
-            self.logger.info("没有文章需要发送，跳过邮件发送")
-            return True
-        
-        # 生成邮件主题
-        if subject is None:
-            subject = f"最新研究文章更新 - {len(articles)} 篇文章"
-        
-        # 生成邮件内容
-        html_content = self._generate_html_content(articles)
-        text_content = self._generate_text_content(articles)
-        
-        # 发送邮件
-        return self._send_email(subject, html_content, text_content)
-    
-    def _generate_html_content(self, articles: List[Dict[str, Any]]) -> str:
-        """
-        生成HTML格式的邮件内容
+    Args:
+        value: 原始文本（可能包含HTML）
         
-        Args:
-            articles: 文章列表
-            
-        Returns:
-            str: HTML格式的邮件内容
-        """
-        html = """
+    Returns:
+        Markup: 可直接输出到HTML的安全内容
+    """
+    if not value:
+        return Markup('')
+    # 标题和摘要中只保留行内标记（如上下标、斜体），其余标签一律去除
+    return Markup(sanitize_html(value, INLINE_TAGS))
+
+# 邮件HTML模板，导入时编译一次；开启自动转义，
+# 标题和摘要可能包含订阅源自带的HTML标记（如上下标），经 inline_html 白名单清理后输出
+_TEMPLATE_ENV = jinja2.Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+_TEMPLATE_ENV.filters['inline_html'] = _inline_html
+_HTML_TEMPLATE = _TEMPLATE_ENV.from_string("""
         <!DOCTYPE html>
         <html>
         <head>
@@ -119,38 +86,88 @@ class EmailNotifier:
         <body>
             <h1>最新研究文章更新</h1>
             <p>以下是根据您的关键词找到的最新研究文章：</p>
-        """
-        
-        # 添加文章信息
-        for article in articles:
-            html += f"""
+        {% for article in articles %}
             <div class="article">
-                <div class="title"><a href="{article['url']}">{article['title']}</a></div>
-                <div class="journal">{article['journal']}</div>
-            """
-            
-            if article['authors']:
-                authors_text = ", ".join(article['authors'])
-                html += f'<div class="authors">{authors_text}</div>'
-            
-            if article.get('published_date'):
-                html += f'<div class="meta">发布日期: {article["published_date"]}</div>'
-            
-            if article.get('doi'):
-                html += f'<div class="meta">DOI: {article["doi"]}</div>'
-            
-            if article['abstract']:
-                html += f'<div class="abstract">{article["abstract"]}</div>'
-            
-            html += '</div>'
-        
-        html += """
+                <div class="title"><a href="{{ article.url }}">{{ article.title | inline_html }}</a></div>
+                <div class="journal">{{ article.journal }}</div>
+                {% if article.authors %}
+                <div class="authors">{{ article.authors | join(", ") }}</div>
+                {% endif %}
+                {% if article.published_date %}
+                <div class="meta">发布日期: {{ article.published_date }}</div>
+                {% endif %}
+                {% if article.doi %}
+                <div class="meta">DOI: {{ article.doi }}</div>
+                {% endif %}
+                {% if article.abstract %}
+                <div class="abstract">{{ article.abstract | inline_html }}</div>
+                {% endif %}
+            </div>
+        {% endfor %}
             <p>此邮件由研究论文追踪器自动生成。</p>
         </body>
         </html>
+        """)
+
+class EmailNotifier:
+    """
+    邮件通知器，负责生成和发送邮件通知
+    """
+    
+    def __init__(self, email_config: Dict[str, Any]):
         """
+        初始化邮件通知器
         
-        return html
+        Args:
+            email_config: 邮件配置
+        """
+        self.sender = os.environ.get('EMAIL_SENDER', email_config.get('sender', ''))
+        self.password = os.environ.get('EMAIL_PASSWORD', email_config.get('password', ''))
+        self.recipients = email_config.get('recipients', [])
+        self.smtp_server = email_config.get('smtp_server', '')
+        self.smtp_port = email_config.get('smtp_port', 587)
+        self.use_tls = email_config.get('use_tls', True)
+        self.logger = logging.getLogger(__name__)
+        # SMTP会话在首次发送时建立，之后的邮件复用同一连接（免去重复的TLS握手和登录）
+        self._smtp: Optional[smtplib.SMTP] = None
+    
+    def send_articles_email(self, articles: List[Dict[str, Any]], subject: Optional[str] = None) -> bool:
+        """
+        发送包含文章列表的邮件
+        
+        Args:
+            articles: 文章列表
+            subject: 邮件主题，默认为自动生成
+            
+        Returns:
+            bool: 是否发送成功
+        """
+        if not articles:
+            self.logger.info("没有文章需要发送，跳过邮件发送")
+            return True
+        
+        # 生成邮件主题
+        if subject is None:
+            subject = f"最新研究文章更新 - {len(articles)} 篇文章"
+        
+        # 生成邮件内容
+        html_content = self._generate_html_content(articles)
+        text_content = self._generate_text_content(articles)
+        
+        # 发送邮件
+        return self._send_email(subject, html_content, text_content)
+    
+    def _generate_html_content(self, articles: List[Dict[str, Any]]) -> str:
+        """
+        生成HTML格式的邮件内容
+        
+        Args:
+            articles: 文章列表
+            
+        Returns:
+            str: HTML格式的邮件内容
+        """
+        return _HTML_TEMPLATE.render(articles=articles)
     
     def _generate_text_content(self, articles: List[Dict[str, Any]]) -> str:
         """
@@ -162,33 +179,36 @@ class EmailNotifier:
         Returns:
             str: 纯文本格式的邮件内容
         """
-        text = "最新研究文章更新\n\n"
-        text += "以下是根据您的关键词找到的最新研究文章：\n\n"
+        lines = [
+            "最新研究文章更新\n\n",
+            "以下是根据您的关键词找到的最新研究文章：\n\n",
+        ]
         
-        # 添加文章信息
+        # 添加文章信息（收集各行后一次拼接）
         for i, article in enumerate(articles, 1):
-            text += f"{i}. {article['title']}\n"
-            text += f"   链接: {article['url']}\n"
-            text += f"   期刊: {article['journal']}\n"
+            lines.append(f"{i}. {article['title']}\n")
+            lines.append(f"   链接: {article['url']}\n")
+            lines.append(f"   期刊: {article['journal']}\n")
             
             if article['authors']:
                 authors_text = ", ".join(article['authors'])
-                text += f"   作者: {authors_text}\n"
+                lines.append(f"   作者: {authors_text}\n")
             
             if article.get('published_date'):
-                text += f"   发布日期: {article['published_date']}\n"
+                lines.append(f"   发布日期: {article['published_date']}\n")
             
             if article.get('doi'):
-                text += f"   DOI: {article['doi']}\n"
+                lines.append(f"   DOI: {article['doi']}\n")
             
-            if article['abstract']:
-                text += f"   摘要: {article['abstract'][:200]}...\n"
+            abstract = article['abstract']
+            if abstract:
+                lines.append(f"   摘要: {abstract[:200]}...\n")
             
-            text += "\n"
+            lines.append("\n")
         
-        text += "此邮件由研究论文追踪器自动生成。"
+        lines.append("此邮件由研究论文追踪器自动生成。")
         
-        return text
+        return "".join(lines)
     
     def _send_email(self, subject: str, html_content: str, text_content: str) -> bool:
         """
@@ -219,20 +239,48 @@ class EmailNotifier:
             msg.attach(part1)
             msg.attach(part2)
             
-            # 连接SMTP服务器并发送邮件
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.ehlo()
-            
-            if self.use_tls:
-                server.starttls()
-                server.ehlo()
-            
-            server.login(self.sender, self.password)
-            server.sendmail(self.sender, self.recipients, msg.as_string())
-            server.quit()
+            # 复用SMTP会话发送邮件，服务器已断开连接时重新连接一次
+            try:
+                self._get_smtp().send_message(msg, self.sender, self.recipients)
+            except smtplib.SMTPServerDisconnected:
+                self._smtp = None
+                self._get_smtp().send_message(msg, self.sender, self.recipients)
             
             self.logger.info(f"成功发送邮件到 {', '.join(self.recipients)}")
             return True
         except Exception as e:
             self.logger.error(f"发送邮件失败: {str(e)}")
             return False
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """
+        获取已登录的SMTP会话，首次调用时连接服务器
+        
+        Returns:
+            smtplib.SMTP: SMTP会话
+        """
+        if self._smtp is None:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            try:
+                server.ehlo()
+                
+                if self.use_tls:
+                    server.starttls()
+                    server.ehlo()
+                
+                server.login(self.sender, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+    
+    def close(self) -> None:
+        """关闭SMTP会话"""
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                # 连接已断开时QUIT会失败，直接关闭套接字
+                self._smtp.close()
+            self._smtp = None
@@ -4,10 +4,33 @@
 import os
 import sqlite3
 import logging
-import json
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(value: Any) -> str:
+        # sqlite3的TEXT列需要str
+        return orjson.dumps(value).decode('utf-8')
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# 每个连接的SQLite参数：WAL模式下NORMAL同步级别已足够安全，减少每次提交的fsync
+_CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA wal_autocheckpoint=1000',
+)
+
+# 单条 IN 查询的最大参数数（低于旧版SQLite的999个变量上限）
+_IN_QUERY_BATCH = 500
+
 class ArticleStorage:
     """
     文章存储管理类，负责文章存储和去重
@@ -28,16 +51,42 @@ class ArticleStorage:
         # 确保数据库目录存在
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
+        # 数据库连接在首次使用时打开，之后各方法复用
+        self._conn: Optional[sqlite3.Connection] = None
+        
         # 初始化数据库
         self._init_db()
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        获取数据库连接，首次调用时打开连接并应用连接级参数
+        
+        Returns:
+            sqlite3.Connection: 数据库连接
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path)
+            for pragma in _CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+    
+    def close(self) -> None:
+        """关闭数据库连接"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def _init_db(self) -> None:
         """初始化数据库表结构"""
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
+            # WAL模式持久保存在数据库文件中，只需设置一次
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
             # 创建文章表
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS articles (
@@ -56,73 +105,104 @@ class ArticleStorage:
                 )
             ''')
             
+            # 清理过期文章按收集日期范围删除，获取未发送文章按发送日期筛选
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_articles_collected_date ON articles(collected_date)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_articles_sent_date ON articles(sent_date)")
+            
             conn.commit()
             self.logger.info("数据库初始化成功")
         except sqlite3.Error as e:
             self.logger.error(f"数据库初始化失败: {str(e)}")
-        finally:
-            if conn:
-                conn.close()
     
-    def save_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def save_articles(self, articles: List[Dict[str, Any]],
+                      accept: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
         """
         保存文章到数据库，并返回新文章（去重后）
         
         Args:
             articles: 文章列表
+            accept: 可选的筛选函数，返回False的文章不保存（如只保存指定日期发布的文章）
             
         Returns:
             List[Dict]: 新文章列表（之前未保存过的）
         """
         new_articles = []
+        skipped_count = 0
         conn = None
         
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
+            collected_date = datetime.now().strftime('%Y-%m-%d')
+            
+            # 一次查出本批中已保存过的URL，之后在内存集合中判断（同时处理批内重复）
+            seen_urls = self._existing_urls(cursor, [article['url'] for article in articles])
+            
+            # 所有插入在同一事务中完成；唯一约束作为兜底，仍使用 INSERT OR IGNORE
             for article in articles:
-                # 检查文章是否已存在
-                cursor.execute("SELECT id FROM articles WHERE url = ?", (article['url'],))
-                result = cursor.fetchone()
+                if accept is not None and not accept(article):
+                    skipped_count += 1
+                    continue
                 
-                if result is None:
-                    # 文章不存在，保存到数据库
-                    collected_date = datetime.now().strftime('%Y-%m-%d')
-                    
-                    cursor.execute('''
-                        INSERT INTO articles (
-                            title, url, abstract, authors, published_date, 
-                            journal, keywords, doi, source_id, collected_date
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        article['title'],
-                        article['url'],
-                        article['abstract'],
-                        json.dumps(article['authors']),
-                        article['published_date'],
-                        article['journal'],
-                        json.dumps(article.get('keywords', [])),
-                        article.get('doi', ''),
-                        article.get('source_id', ''),
-                        collected_date
-                    ))
-                    
-                    # 添加到新文章列表
+                url = article['url']
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                
+                cursor.execute('''
+                    INSERT OR IGNORE INTO articles (
+                        title, url, abstract, authors, published_date, 
+                        journal, keywords, doi, source_id, collected_date
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    article['title'],
+                    article['url'],
+                    article['abstract'],
+                    _json_dumps(article['authors']),
+                    article['published_date'],
+                    article['journal'],
+                    _json_dumps(article.get('keywords', [])),
+                    article.get('doi', ''),
+                    article.get('source_id', ''),
+                    collected_date
+                ))
+                
+                # 实际插入了一行即为新文章
+                if cursor.rowcount == 1:
                     new_articles.append(article)
             
             conn.commit()
+            if accept is not None:
+                self.logger.info(f"筛选后剩余 {len(articles) - skipped_count} 篇文章")
             self.logger.info(f"保存了 {len(new_articles)} 篇新文章")
         except sqlite3.Error as e:
             self.logger.error(f"保存文章失败: {str(e)}")
             if conn:
                 conn.rollback()
-        finally:
-            if conn:
-                conn.close()
         
         return new_articles
     
+    def _existing_urls(self, cursor: sqlite3.Cursor, urls: List[str]) -> Set[str]:
+        """
+        查询已保存在数据库中的URL
+        
+        Args:
+            cursor: 数据库游标
+            urls: 待查询的URL列表
+            
+        Returns:
+            Set[str]: 其中已存在的URL集合
+        """
+        existing = set()
+        unique_urls = list(dict.fromkeys(urls))
+        for start in range(0, len(unique_urls), _IN_QUERY_BATCH):
+            batch = unique_urls[start:start + _IN_QUERY_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            cursor.execute(f"SELECT url FROM articles WHERE url IN ({placeholders})", batch)
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
+    
     def mark_articles_as_sent(self, article_urls: List[str]) -> None:
         """
         标记文章为已发送
@@ -132,16 +212,16 @@ class ArticleStorage:
         """
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             sent_date = datetime.now().strftime('%Y-%m-%d')
             
-            for url in article_urls:
-                cursor.execute(
-                    "UPDATE articles SET sent_date = ? WHERE url = ?",
-                    (sent_date, url)
-                )
+            # 一次绑定所有参数，在同一事务中批量更新
+            cursor.executemany(
+                "UPDATE articles SET sent_date = ? WHERE url = ?",
+                [(sent_date, url) for url in article_urls]
+            )
             
             conn.commit()
             self.logger.info(f"标记了 {len(article_urls)} 篇文章为已发送")
@@ -149,9 +229,6 @@ class ArticleStorage:
             self.logger.error(f"标记文章为已发送失败: {str(e)}")
             if conn:
                 conn.rollback()
-        finally:
-            if conn:
-                conn.close()
     
     def get_unsent_articles(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -167,9 +244,10 @@ class ArticleStorage:
         conn = None
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._connect()
             cursor = conn.cursor()
+            # 仅对本次查询的游标返回行对象，不影响共享连接
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT * FROM articles 
@@ -183,16 +261,13 @@ class ArticleStorage:
             for row in rows:
                 article = dict(row)
                 # 将JSON字符串转换回列表
-                article['authors'] = json.loads(article['authors'])
-                article['keywords'] = json.loads(article['keywords'])
+                article['authors'] = _json_loads(article['authors'])
+                article['keywords'] = _json_loads(article['keywords'])
                 articles.append(article)
             
             self.logger.info(f"获取了 {len(articles)} 篇未发送的文章")
         except sqlite3.Error as e:
             self.logger.error(f"获取未发送文章失败: {str(e)}")
-        finally:
-            if conn:
-                conn.close()
         
         return articles
     
@@ -200,7 +275,7 @@ class ArticleStorage:
         """清理过期文章"""
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             # 计算截止日期
@@ -220,6 +295,3 @@ class ArticleStorage:
             self.logger.error(f"清理过期文章失败: {str(e)}")
             if conn:
                 conn.rollback()
-        finally:
-            if conn:
-                conn.close()
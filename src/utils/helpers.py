@@ -2,10 +2,77 @@
 辅助函数模块 - 提供通用辅助函数
 """
 import re
+import sys
 import time
-import random
+import itertools
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
+# 常见日期格式（按出现频率排列）
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y/%m/%d",
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d %B %Y",
+)
+
+# 按日期字符串的开头结构划分格式，只尝试可能匹配的格式
+_DATE_FORMAT_BUCKETS = (
+    (re.compile(r'\d{4}[-/]'), _DATE_FORMATS[0:4]),          # 年在前（2024-01-31、2024/01/31）
+    (re.compile(r'\d{1,2}[-/]'), _DATE_FORMATS[4:6]),        # 日在前（31-01-2024、31/01/2024）
+    (re.compile(r'\d{1,2} [A-Za-z]'), _DATE_FORMATS[8:10]),  # 日 月名 年（31 Jan 2024）
+    (re.compile(r'[A-Za-z]'), _DATE_FORMATS[6:8]),           # 月名在前（Jan 31, 2024）
+)
+
+# 常见日期形式的正则分支：一次匹配即可直接取出年月日，无需逐个格式尝试 strptime
+# 每个分支的字段组命名为 <分支名>_<字段>，y/m/d/H/M/S 为数字，b 为英文月份名
+_DATE_BRANCHES = (
+    ('iso', r'(?P<iso_y>\d{4})-(?P<iso_m>\d{2})-(?P<iso_d>\d{2})'
+            r'(?:T(?P<iso_H>\d{2}):(?P<iso_M>\d{2}):(?P<iso_S>\d{2})Z?)?'),
+    ('ymd', r'(?P<ymd_y>\d{4})/(?P<ymd_m>\d{2})/(?P<ymd_d>\d{2})'),
+    ('dmy', r'(?P<dmy_d>\d{2})(?P<dmy_sep>[-/])(?P<dmy_m>\d{2})(?P=dmy_sep)(?P<dmy_y>\d{4})'),
+    ('bdy', r'(?P<bdy_b>[A-Za-z]{3,9}) (?P<bdy_d>\d{1,2}), (?P<bdy_y>\d{4})'),
+    ('dby', r'(?P<dby_d>\d{1,2}) (?P<dby_b>[A-Za-z]{3,9}) (?P<dby_y>\d{4})'),
+)
+_DATE_PATTERN = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _DATE_BRANCHES),
+    re.ASCII
+)
+
+# 英文月份名（全称和缩写，小写）到月份的映射
+_MONTHS = {
+    name.lower(): index
+    for index, (full, abbr) in enumerate(zip(
+        ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+         'August', 'September', 'October', 'November', 'December'),
+        ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+    ), start=1)
+    for name in (full, abbr)
+}
+
+# 严格的 yyyy-mm-dd 日期，输出格式相同时可直接返回原字符串
+_ISO_FAST = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+# 默认输出格式及其结果缓存（日期字符串 -> 格式化结果，有大小上限）
+_DEFAULT_DATE_FORMAT = "%Y-%m-%d"
+_DEFAULT_FORMAT_CACHE: Dict[str, Optional[str]] = {}
+_DEFAULT_FORMAT_CACHE_SIZE = 8192
+_MISSING = object()
+
+# 短于此长度的清理结果会被驻留（sys.intern），重复出现的标题、日期等共享同一个对象
+_INTERN_MAX_LENGTH = 64
+
+# 唯一ID：进程启动时的纳秒时间戳前缀 + 进程内单调递增计数器
+_ID_PREFIX = f"{time.time_ns():x}"
+_ID_COUNTER = itertools.count()
+
 def clean_text(text: str) -> str:
     """
     清理文本，移除多余空白字符
@@ -19,24 +86,36 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # 替换多个空白字符为单个空格
-    text = re.sub(r'\s+', ' ', text)
-    # 移除首尾空白
-    return text.strip()
+    # 按任意空白切分后以单个空格连接，同时去除了首尾空白
+    result = ' '.join(text.split())
+    return sys.intern(result) if len(result) < _INTERN_MAX_LENGTH else result
+
+def clean_texts(texts: List[str]) -> List[str]:
+    """
+    批量清理文本，结果与逐个调用 clean_text 相同
+    
+    Args:
+        texts: 原始文本列表
+        
+    Returns:
+        List[str]: 清理后的文本列表
+    """
+    cleaned = (' '.join(text.split()) if text else "" for text in texts)
+    return [sys.intern(result) if len(result) < _INTERN_MAX_LENGTH else result for result in cleaned]
 
 def generate_unique_id(prefix: str = "") -> str:
     """
     生成唯一ID
     
+    同一进程内连续调用不会重复（不依赖当前毫秒时间和随机数）
+    
     Args:
         prefix: ID前缀
         
     Returns:
         str: 唯一ID
     """
-    timestamp = int(time.time() * 1000)
-    random_num = random.randint(1000, 9999)
-    return f"{prefix}{timestamp}{random_num}"
+    return f"{prefix}{_ID_PREFIX}{next(_ID_COUNTER):x}"
 
 def truncate_text(text: str, max_length: int = 200, add_ellipsis: bool = True) -> str:
     """
@@ -56,16 +135,20 @@ def truncate_text(text: str, max_length: int = 200, add_ellipsis: bool = True) -
     if len(text) <= max_length:
         return text
     
-    truncated = text[:max_length].rstrip()
-    if add_ellipsis:
-        truncated += "..."
+    truncated = text[:max_length]
+    # 截断处为空白字符时才需要去除尾部空白
+    if max_length <= 0 or truncated[-1].isspace():
+        truncated = truncated.rstrip()
     
-    return truncated
+    return f"{truncated}..." if add_ellipsis else truncated
 
 def format_date(date_str: Optional[str], output_format: str = "%Y-%m-%d") -> Optional[str]:
     """
     格式化日期字符串
     
+    同一日期字符串会被大量文章重复使用：默认输出格式的结果按日期字符串缓存在字典中，
+    其他输出格式按 (date_str, output_format) 缓存
+    
     Args:
         date_str: 日期字符串
         output_format: 输出格式
@@ -76,25 +159,105 @@ def format_date(date_str: Optional[str], output_format: str = "%Y-%m-%d") -> Opt
     if not date_str:
         return None
     
-    # 常见日期格式列表
-    date_formats = [
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%d-%m-%Y",
-        "%d/%m/%Y",
-        "%b %d, %Y",
-        "%B %d, %Y",
-        "%d %b %Y",
-        "%d %B %Y",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%SZ"
-    ]
+    if output_format != _DEFAULT_DATE_FORMAT:
+        return _format_date_cached(date_str, output_format)
+    
+    result = _DEFAULT_FORMAT_CACHE.get(date_str, _MISSING)
+    if result is _MISSING:
+        result = _parse_and_format_date(date_str, output_format)
+        # 缓存已满时不再加入新条目
+        if len(_DEFAULT_FORMAT_CACHE) < _DEFAULT_FORMAT_CACHE_SIZE:
+            _DEFAULT_FORMAT_CACHE[date_str] = result
+    return result
+
+def format_dates(date_strs: List[Optional[str]], output_format: str = "%Y-%m-%d") -> List[Optional[str]]:
+    """
+    批量格式化日期字符串，结果与逐个调用 format_date 相同
+    
+    每个不同的日期字符串只格式化一次
+    
+    Args:
+        date_strs: 日期字符串列表
+        output_format: 输出格式
+        
+    Returns:
+        List[str or None]: 格式化后的日期字符串列表，格式化失败的位置为None
+    """
+    formatted = {date_str: format_date(date_str, output_format) for date_str in set(date_strs)}
+    return [formatted[date_str] for date_str in date_strs]
+
+@lru_cache(maxsize=4096)
+def _format_date_cached(date_str: str, output_format: str) -> Optional[str]:
+    """按 (date_str, output_format) 缓存的非默认输出格式"""
+    return _parse_and_format_date(date_str, output_format)
+
+def _parse_and_format_date(date_str: str, output_format: str) -> Optional[str]:
+    """
+    解析日期字符串并按输出格式重新格式化（不使用缓存）
+    
+    Args:
+        date_str: 非空日期字符串
+        output_format: 输出格式
+        
+    Returns:
+        str or None: 格式化后的日期字符串，格式化失败时返回None
+    """
+    # 已是目标格式的ISO日期：校验取值范围后原样返回，跳过解析和重新格式化
+    if output_format == _DEFAULT_DATE_FORMAT:
+        match = _ISO_FAST.fullmatch(date_str)
+        if match:
+            try:
+                datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+                return sys.intern(date_str)
+            except ValueError:
+                return None
+    
+    # 常见形式由正则直接构造日期，其余情况（或取值无效时）再逐个格式尝试
+    dt = _match_date(date_str)
+    if dt is not None:
+        return sys.intern(dt.strftime(output_format))
+    
+    # 根据开头结构选择候选格式，无法判断时尝试全部格式
+    date_formats = _DATE_FORMATS
+    for prefix_re, bucket in _DATE_FORMAT_BUCKETS:
+        if prefix_re.match(date_str):
+            date_formats = bucket
+            break
     
     for fmt in date_formats:
         try:
-            dt = time.strptime(date_str, fmt)
-            return time.strftime(output_format, dt)
+            return sys.intern(datetime.strptime(date_str, fmt).strftime(output_format))
         except ValueError:
             continue
     
     return None
+
+def _match_date(date_str: str) -> Optional[datetime]:
+    """
+    用正则分支匹配常见日期形式并直接构造日期
+    
+    Args:
+        date_str: 日期字符串
+        
+    Returns:
+        datetime or None: 未匹配任何分支或取值无效时返回None
+    """
+    match = _DATE_PATTERN.fullmatch(date_str)
+    if match is None:
+        return None
+    
+    branch = match.lastgroup
+    fields = match.groupdict()
+    month_name = fields.get(f'{branch}_b')
+    month = _MONTHS.get(month_name.lower()) if month_name else int(fields[f'{branch}_m'])
+    if month is None:
+        return None
+    
+    hour = fields.get(f'{branch}_H')
+    try:
+        if hour is None:
+            return datetime(int(fields[f'{branch}_y']), month, int(fields[f'{branch}_d']))
+        return datetime(int(fields[f'{branch}_y']), month, int(fields[f'{branch}_d']),
+                        int(hour), int(fields[f'{branch}_M']), int(fields[f'{branch}_S']))
+    except ValueError:
+        return None
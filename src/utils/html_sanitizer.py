@@ -0,0 +1,92 @@
+"""
+HTML清理模块 - 基于白名单清理订阅源提供的HTML片段
+
+只保留白名单中的标签（一律去掉属性），script/style等标签连同内容一起去除，
+其余标签只保留文本。基于标准库 html.parser，不依赖第三方库的内部实现。
+"""
+from html.parser import HTMLParser
+from typing import FrozenSet, List
+
+# 行内标记（化学式、物种名等常用）
+INLINE_TAGS = frozenset({'sub', 'sup', 'i', 'b', 'em'})
+
+# 订阅源摘要/正文中保留的标签：行内标记加上常见的段落和列表结构
+FEED_TAGS = INLINE_TAGS | frozenset({
+    'p', 'br', 'div', 'span', 'strong', 'u', 'code', 'pre',
+    'blockquote', 'ul', 'ol', 'li',
+})
+
+# 连同内容一起去除的标签
+_DROP_CONTENT_TAGS = frozenset({'script', 'style', 'iframe', 'object', 'noscript', 'template'})
+
+# 没有结束标签的空元素
+_VOID_TAGS = frozenset({'br'})
+
+class _WhitelistParser(HTMLParser):
+    """
+    按白名单重新输出HTML：保留的标签不带属性，文本中的尖括号一律转义
+    """
+
+    def __init__(self, allowed_tags: FrozenSet[str], escape_ampersand: bool):
+        super().__init__(convert_charrefs=True)
+        self.allowed_tags = allowed_tags
+        self.escape_ampersand = escape_ampersand
+        self.parts: List[str] = []
+        self.open_tags: List[str] = []
+        self.drop_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _DROP_CONTENT_TAGS:
+            self.drop_depth += 1
+        elif tag in self.allowed_tags and not self.drop_depth:
+            if tag in _VOID_TAGS:
+                self.parts.append(f'<{tag} />')
+            else:
+                self.parts.append(f'<{tag}>')
+                self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # 自闭合标签没有内容，不影响 script/style 等标签的计数
+        if tag in self.allowed_tags and tag in _VOID_TAGS and not self.drop_depth:
+            self.parts.append(f'<{tag} />')
+
+    def handle_endtag(self, tag):
+        if tag in _DROP_CONTENT_TAGS:
+            self.drop_depth = max(0, self.drop_depth - 1)
+        elif tag in self.open_tags and not self.drop_depth:
+            # 关闭到匹配的标签为止，保证输出的标签成对嵌套
+            while self.open_tags:
+                open_tag = self.open_tags.pop()
+                self.parts.append(f'</{open_tag}>')
+                if open_tag == tag:
+                    break
+
+    def handle_data(self, data):
+        if self.drop_depth:
+            return
+        if self.escape_ampersand:
+            data = data.replace('&', '&amp;')
+        self.parts.append(data.replace('<', '&lt;').replace('>', '&gt;'))
+
+    def result(self) -> str:
+        self.close()
+        return ''.join(self.parts) + ''.join(f'</{tag}>' for tag in reversed(self.open_tags))
+
+def sanitize_html(value: str, allowed_tags: FrozenSet[str] = FEED_TAGS, escape_ampersand: bool = True) -> str:
+    """
+    按白名单清理HTML片段
+
+    Args:
+        value: 原始HTML
+        allowed_tags: 保留的标签
+        escape_ampersand: 是否将文本中的 & 转义为 &amp;（输出直接嵌入HTML时应转义；
+            存储为订阅源字段时保持与feedparser一致，不转义）
+
+    Returns:
+        str: 清理后的HTML
+    """
+    if not value:
+        return ''
+    parser = _WhitelistParser(allowed_tags, escape_ampersand)
+    parser.feed(value)
+    return parser.result()
@@ -0,0 +1,167 @@
+"""
+HTTP缓存模块 - 基于ETag/Last-Modified的条件请求缓存
+
+每个请求URL对应一个JSON文件（文件名为缓存键的SHA-1），保存服务器返回的校验信息和解析后的文章列表。
+缓存键可能包含API密钥等查询参数，文件内容和日志中只记录其摘要，不保存键本身。
+再次请求时附带 If-None-Match / If-Modified-Since，服务器返回304时直接复用缓存的文章，
+跳过下载和解析。
+"""
+import os
+import json
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlencode
+
+DEFAULT_CACHE_DIR = 'data/http_cache'
+
+class HttpCache:
+    """
+    条件请求缓存，按URL保存校验信息和文章列表
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        """
+        初始化HTTP缓存
+
+        Args:
+            cache_dir: 缓存目录，为空时禁用缓存
+        """
+        self.cache_dir = cache_dir
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def enabled(self) -> bool:
+        """是否启用缓存"""
+        return bool(self.cache_dir)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        根据URL和查询参数生成缓存键
+
+        Args:
+            url: 请求URL
+            params: 查询参数
+
+        Returns:
+            str: 缓存键
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items(), key=lambda item: str(item[0])))}"
+
+    @staticmethod
+    def _digest(key: str) -> str:
+        """缓存键的SHA-1摘要"""
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    def _path_for(self, digest: str) -> str:
+        """缓存键摘要对应的文件路径"""
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """读取缓存条目，不存在或损坏时返回None"""
+        if not self.enabled:
+            return None
+
+        digest = self._digest(key)
+        try:
+            with open(self._path_for(digest), 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"读取HTTP缓存失败 {digest}: {str(e)}")
+            return None
+
+        return entry if entry.get('key_sha1') == digest else None
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """
+        获取条件请求头
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            Dict: If-None-Match / If-Modified-Since 请求头，无缓存时为空字典
+        """
+        entry = self._load_entry(key)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load_articles(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        获取缓存的文章列表
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            List[Dict] or None: 缓存的文章列表，无缓存时返回None
+        """
+        entry = self._load_entry(key)
+        return entry.get('articles') if entry else None
+
+    def store(self, key: str, etag: Optional[str], last_modified: Optional[str],
+              articles: List[Dict[str, Any]]) -> None:
+        """
+        保存校验信息和文章列表
+
+        服务器未提供任何校验信息或没有解析到文章时不缓存，避免一次解析失败
+        （如流式读取中途断开）导致后续304一直返回空结果
+
+        Args:
+            key: 缓存键
+            etag: 响应的ETag
+            last_modified: 响应的Last-Modified
+            articles: 解析后的文章列表
+        """
+        if not self.enabled or not articles or not (etag or last_modified):
+            return
+
+        digest = self._digest(key)
+        entry = {
+            'key_sha1': digest,
+            'etag': etag,
+            'last_modified': last_modified,
+            'articles': articles
+        }
+
+        path = self._path_for(digest)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(entry, file, ensure_ascii=False)
+            # 原子替换，避免并发采集时读到写了一半的文件
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"写入HTTP缓存失败 {digest}: {str(e)}")
+
+_HTTP_CACHE = HttpCache()
+
+def configure_http_cache(cache_dir: Optional[str]) -> None:
+    """
+    设置HTTP缓存目录
+
+    Args:
+        cache_dir: 缓存目录，为空时禁用缓存
+    """
+    _HTTP_CACHE.cache_dir = cache_dir
+
+def get_http_cache() -> HttpCache:
+    """
+    获取模块级共享HTTP缓存
+
+    Returns:
+        HttpCache: 共享缓存
+    """
+    return _HTTP_CACHE
@@ -0,0 +1,71 @@
+"""
+HTTP会话模块 - 提供各采集器共享的requests会话（连接池复用）
+"""
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# 连接池配置：POOL_CONNECTIONS 为缓存连接池的主机数，超出后最近最少使用的主机连接池会被淘汰，
+# 需不少于所有采集器（RSS/API/网页）共用会话访问的主机数；POOL_MAXSIZE 为每个主机保持的连接数，
+# 与 main.py 中并发采集的线程数一致
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+# 重试配置
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_FORCELIST = [429, 500, 502, 503, 504]
+
+# 默认请求头：urllib3仅在安装了brotli时才在ACCEPT_ENCODING中包含br，避免收到无法解压的响应
+DEFAULT_HEADERS = {
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Accept': 'application/json, application/atom+xml, application/rss+xml;q=0.9, */*;q=0.5',
+    'User-Agent': 'PaperRadar/1.0',
+}
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+def _create_session() -> requests.Session:
+    """
+    创建挂载了连接池和重试策略、默认请求压缩响应的会话
+
+    Returns:
+        requests.Session: 新建的会话
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_FORCELIST
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def get_session() -> requests.Session:
+    """
+    获取模块级共享会话，同一主机的多次请求复用TCP/TLS连接
+
+    注意：会话在所有采集器间共享，特定数据源的请求头应按请求传入，
+    不要修改 session.headers。
+
+    Returns:
+        requests.Session: 共享会话
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _create_session()
+    return _SESSION
@@ -2,14 +2,62 @@
 日志工具模块 - 提供日志记录功能
 """
 import os
+import time
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# 日志格式
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# 支持的日志级别名称
+_LEVELS = {name: getattr(logging, name) for name in ('DEBUG', 'INFO', 'WARNING', 'WARN', 'ERROR', 'CRITICAL', 'FATAL')}
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    缓存时间字符串的格式化器，同一秒内的日志记录只调用一次 time.strftime
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        # (秒, 时间字符串) 作为一个整体替换，多个处理器共用时不会读到不一致的组合
+        self._cached_time = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, time_str = self._cached_time
+        if second != cached_second:
+            time_str = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached_time = (second, time_str)
+        
+        if datefmt:
+            return time_str
+        return self.default_msec_format % (time_str, record.msecs)
+
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """
+    延迟打开的轮转文件处理器，首次写入日志时才创建日志目录并打开文件
+    """
+    
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0):
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, delay=True)
+    
+    def _open(self):
+        # baseFilename 为绝对路径，目录名不会为空
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+# 后台写日志的监听器（setup_logger 中创建）
+_QUEUE_LISTENER: Optional[QueueListener] = None
+
 def setup_logger(log_file: str, log_level: str = 'INFO', max_size_mb: int = 10, backup_count: int = 5) -> logging.Logger:
     """
     设置日志记录器
     
+    调用方线程只将日志记录放入队列，由后台监听线程格式化并写入控制台和文件
+    
     Args:
         log_file: 日志文件路径
         log_level: 日志级别
@@ -19,36 +67,84 @@ def setup_logger(log_file: str, log_level: str = 'INFO', max_size_mb: int = 10,
     Returns:
         logging.Logger: 配置好的日志记录器
     """
-    # 确保日志目录存在
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
-    
-    # 获取日志级别
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    global _QUEUE_LISTENER
     
     # 配置根日志记录器
     logger = logging.getLogger()
+    
+    # 已由本函数配置且监听线程仍在运行时直接返回，避免重复打开日志文件
+    if _QUEUE_LISTENER is not None and any(getattr(handler, '_paper_radar', False) for handler in logger.handlers):
+        return logger
+    
+    # 获取日志级别
+    numeric_level = _LEVELS.get(log_level.upper())
+    unknown_level = numeric_level is None
+    if unknown_level:
+        numeric_level = logging.INFO
     logger.setLevel(numeric_level)
     
+    # 日志格式不包含线程/进程信息，创建日志记录时跳过相关查询
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # 清除现有处理器
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
+    # 控制台和文件处理器共用同一个格式化器
+    formatter = _CachedTimeFormatter(LOG_FORMAT)
+    
     # 创建控制台处理器
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
-    console_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
     
-    # 创建文件处理器
-    file_handler = RotatingFileHandler(
+    # 创建文件处理器（首次写入时才创建目录和打开文件）
+    file_handler = _LazyRotatingFileHandler(
         log_file,
         maxBytes=max_size_mb * 1024 * 1024,
         backupCount=backup_count
     )
     file_handler.setLevel(numeric_level)
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    file_handler.setFormatter(formatter)
+    
+    # 根日志记录器只挂载队列处理器，实际输出由后台监听线程完成
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler._paper_radar = True
+    logger.addHandler(queue_handler)
+    
+    _QUEUE_LISTENER = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _QUEUE_LISTENER.start()
+    # 进程退出前写完队列中剩余的日志（重复配置时只注册一次）
+    atexit.unregister(stop_logger)
+    atexit.register(stop_logger)
+    
+    if unknown_level:
+        logger.warning(f"未知的日志级别 {log_level}，使用 INFO")
     
     return logger
+
+def stop_logger() -> None:
+    """
+    停止后台日志监听线程，写完队列中剩余的日志并关闭处理器
+    
+    同时移除根日志记录器上的队列处理器，之后可再次调用 setup_logger 重新配置
+    """
+    global _QUEUE_LISTENER
+    if _QUEUE_LISTENER is None:
+        return
+    
+    listener = _QUEUE_LISTENER
+    _QUEUE_LISTENER = None
+    
+    # 先移除根日志记录器上的队列处理器，之后的日志不再进入无人处理的队列
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if getattr(handler, '_paper_radar', False):
+            root_logger.removeHandler(handler)
+    
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
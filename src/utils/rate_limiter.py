@@ -0,0 +1,73 @@
+"""
+速率限制模块 - 提供按主机共享的令牌桶限流器
+"""
+import time
+import threading
+from typing import Dict, Optional
+
+class TokenBucket:
+    """
+    令牌桶限流器，允许突发请求至桶容量，随后按固定速率放行
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数（即稳定请求速率）
+            capacity: 桶容量（允许的最大突发请求数），默认与速率相同且不小于1
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """按流逝时间补充令牌"""
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+
+    def acquire(self) -> None:
+        """
+        获取一个令牌，令牌不足时阻塞等待
+
+        采用预约方式：令牌数允许为负，表示已被预约的未来令牌，调用方只需按
+        计算出的截止时间等待一次。请求本身耗时超过发放间隔时无需等待。
+        """
+        if self.rate <= 0:
+            return
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        # 在锁外等待，不阻塞其他线程预约
+        if wait > 0:
+            time.sleep(wait)
+
+_BUCKETS: Dict[str, TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+def get_rate_limiter(host: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """
+    获取指定主机的共享令牌桶，同一主机的所有采集器共用一个限流器
+
+    Args:
+        host: 主机名（如 export.arxiv.org）
+        rate: 每秒请求数
+        capacity: 桶容量
+
+    Returns:
+        TokenBucket: 该主机的令牌桶
+    """
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(host)
+        if bucket is None:
+            bucket = TokenBucket(rate, capacity)
+            _BUCKETS[host] = bucket
+        return bucket
@@ -0,0 +1,35 @@
+"""
+config_manager 测试 - YAML解析结果的JSON缓存失效
+"""
+import os
+
+from src.config_manager import ConfigManager
+
+def _write(path, content):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content)
+
+def test_backdated_yaml_edit_invalidates_json_cache(tmp_path):
+    yaml_path = tmp_path / 'keywords.yaml'
+    cache_path = tmp_path / 'keywords.cache.json'
+    
+    _write(yaml_path, 'keywords:\n  - old\n')
+    assert ConfigManager(str(tmp_path))._load_yaml(str(yaml_path)) == {'keywords': ['old']}
+    assert cache_path.exists()
+    
+    # 部署一个保留了更早修改时间的新版本（如 rsync -t / cp -p），缓存文件比它新
+    _write(yaml_path, 'keywords:\n  - new\n')
+    old_time = os.stat(cache_path).st_mtime - 3600
+    os.utime(yaml_path, (old_time, old_time))
+    
+    assert ConfigManager(str(tmp_path))._load_yaml(str(yaml_path)) == {'keywords': ['new']}
+
+def test_unchanged_yaml_is_read_from_json_cache(tmp_path):
+    yaml_path = tmp_path / 'config.yaml'
+    _write(yaml_path, 'run:\n  max_articles: 5\n')
+    ConfigManager(str(tmp_path))._load_yaml(str(yaml_path))
+    
+    # 缓存命中时不需要重新解析YAML
+    manager = ConfigManager(str(tmp_path))
+    manager._write_json_cache = None
+    assert manager._load_yaml(str(yaml_path)) == {'run': {'max_articles': 5}}
@@ -0,0 +1,20 @@
+"""
+email_notifier 测试 - HTML邮件中订阅源内容的转义和清理
+"""
+from src.notifiers.email_notifier import EmailNotifier
+
+def test_feed_markup_is_whitelisted_in_html_email():
+    html = EmailNotifier({})._generate_html_content([{
+        'title': 'H<sub>2</sub>O <script>alert(1)</script>',
+        'url': 'http://example.com/"x',
+        'journal': 'Journal <b>',
+        'authors': ['A <img src=x onerror=alert(2)>'],
+        'abstract': '<p onclick="steal()">Study of <i>E. coli</i> &amp; <iframe src="x"></iframe>sub<sup>2</sup></p>',
+    }])
+    
+    assert '<script' not in html and 'alert(1)' not in html
+    assert 'onclick' not in html and '<iframe' not in html and '<img' not in html
+    assert 'H<sub>2</sub>O' in html
+    assert 'Study of <i>E. coli</i> &amp; sub<sup>2</sup>' in html
+    assert 'Journal &lt;b&gt;' in html
+    assert 'href="http://example.com/&#34;x"' in html
@@ -0,0 +1,19 @@
+"""
+http_cache 测试 - 缓存文件不保存请求参数中的凭据
+"""
+import os
+
+from src.utils.http_cache import HttpCache
+
+def test_cache_file_does_not_contain_request_key(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    key = cache.make_key('https://api.example.com/search', {'query': 'battery', 'apiKey': 'secret-key-123'})
+    articles = [{'title': 'A', 'url': 'https://example.com/a'}]
+    
+    cache.store(key, '"etag"', None, articles)
+    
+    assert cache.load_articles(key) == articles
+    assert cache.conditional_headers(key) == {'If-None-Match': '"etag"'}
+    for name in os.listdir(tmp_path):
+        with open(os.path.join(tmp_path, name), encoding='utf-8') as file:
+            assert 'secret-key-123' not in file.read()
@@ -0,0 +1,42 @@
+"""
+logger 测试 - 日志配置的启动、停止与重新配置
+"""
+import logging
+
+from src.utils.logger import setup_logger, stop_logger
+
+def _read(path):
+    with open(path, encoding='utf-8') as file:
+        return file.read()
+
+def test_setup_after_stop_logs_again(tmp_path):
+    first_log = tmp_path / 'first' / 'app.log'
+    second_log = tmp_path / 'second' / 'app.log'
+    root_logger = logging.getLogger()
+    try:
+        setup_logger(str(first_log))
+        logging.getLogger('test').info('first run')
+        stop_logger()
+        
+        assert not any(getattr(handler, '_paper_radar', False) for handler in root_logger.handlers)
+        assert 'first run' in _read(first_log)
+        
+        setup_logger(str(second_log))
+        logging.getLogger('test').info('second run')
+        stop_logger()
+        
+        assert 'second run' in _read(second_log)
+        assert 'second run' not in _read(first_log)
+    finally:
+        stop_logger()
+
+def test_repeated_setup_is_idempotent(tmp_path):
+    log_file = tmp_path / 'app.log'
+    root_logger = logging.getLogger()
+    try:
+        setup_logger(str(log_file))
+        handlers = list(root_logger.handlers)
+        assert setup_logger(str(log_file)) is root_logger
+        assert root_logger.handlers == handlers
+    finally:
+        stop_logger()
@@ -0,0 +1,60 @@
+"""
+xml_feed_parser 测试 - HTML字段清理
+"""
+import io
+
+from src.collectors.xml_feed_parser import parse_feed_entries
+
+def _parse(xml: bytes):
+    return parse_feed_entries(io.BytesIO(xml))
+
+def test_rss_description_is_sanitized():
+    entry = _parse(b'''<?xml version="1.0"?>
+        <rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><item>
+            <title>H&lt;sub&gt;2&lt;/sub&gt;O &amp; more</title>
+            <link>http://example.com/1</link>
+            <description>&lt;p&gt;Abstract &lt;script&gt;alert(1)&lt;/script&gt; text
+                &lt;img src="x" onerror="alert(2)"/&gt;&lt;/p&gt;</description>
+            <content:encoded><![CDATA[<p onclick="steal()">Body <a href="javascript:alert(3)">link</a></p>]]></content:encoded>
+        </item></channel></rss>''')[0]
+    
+    assert entry['title'] == 'H<sub>2</sub>O & more'
+    assert '<script' not in entry['summary'] and 'alert(1)' not in entry['summary']
+    assert 'onerror' not in entry['summary']
+    assert entry['summary'].startswith('<p>Abstract')
+    
+    content = entry['content'][0]['value']
+    assert 'onclick' not in content and 'javascript:' not in content
+    assert 'Body' in content
+
+def test_atom_xhtml_summary_keeps_safe_markup():
+    entry = _parse(b'''<feed xmlns="http://www.w3.org/2005/Atom"><entry>
+            <title type="text">A &lt;b&gt; B</title>
+            <summary type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Lead <i>H<sub>2</sub>O</i> tail <script>bad()</script></div></summary>
+            <content type="html">&lt;b&gt;x&lt;/b&gt;&lt;script&gt;y()&lt;/script&gt;</content>
+        </entry></feed>''')[0]
+    
+    # type="text" 为纯文本，原样保留
+    assert entry['title'] == 'A <b> B'
+    assert entry['summary'] == 'Lead <i>H<sub>2</sub>O</i> tail'
+    assert entry['content'][0]['value'] == '<b>x</b>'
+
+def test_media_content_does_not_shadow_content_encoded():
+    entry = _parse(b'''<?xml version="1.0"?>
+        <rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+             xmlns:media="http://search.yahoo.com/mrss/"><channel><item>
+            <title>Paper</title>
+            <media:content url="http://example.com/figure.jpg" type="image/jpeg"/>
+            <content:encoded>REAL ABSTRACT</content:encoded>
+        </item></channel></rss>''')[0]
+    
+    assert entry['content'] == [{'value': 'REAL ABSTRACT'}]
+
+def test_empty_content_does_not_block_later_content():
+    entry = _parse(b'''<?xml version="1.0"?>
+        <rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><item>
+            <content></content>
+            <content:encoded><![CDATA[<p>Body</p>]]></content:encoded>
+        </item></channel></rss>''')[0]
+    
+    assert entry['content'] == [{'value': '<p>Body</p>'}]